@@ -0,0 +1,132 @@
+"""
+Record query plans and latencies of the filtered movie lookups with and without the
+secondary indexes of `movies` and the association tables:
+
+* movies of a genre, an actor or a language (reverse `(entity_id, movie_id)` indexes);
+* movies of a country, a release-date range and a score range (`(column, id)` indexes).
+
+The catalogue is seeded once; the indexes are dropped for the "before" run and recreated
+(and the statistics refreshed) for the "after" run.
+
+Usage (from the `src` directory):
+
+    python -m benchmarks.indexes --movies 100000 --repeat 50
+    BENCHMARK_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.indexes
+"""
+
+import argparse
+import asyncio
+import datetime
+from typing import Dict, List
+
+from sqlalchemy import Index, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from benchmarks.common import create_benchmark_engine, measure, seed_synthetic_catalogue, summarize
+from database.models import (
+    ActorsMoviesModel,
+    MovieModel,
+    MoviesGenresModel,
+    MoviesLanguagesModel,
+)
+from filters import movie_ids_for
+
+PAGE_SIZE = 20
+
+
+def secondary_indexes() -> List[Index]:
+    """
+    Return the non-unique indexes declared on `movies` and the association tables.
+    """
+    tables = (MovieModel.__table__, MoviesGenresModel, ActorsMoviesModel, MoviesLanguagesModel)
+    return [index for table in tables for index in table.indexes if not index.unique]
+
+
+def lookup_queries() -> Dict[str, object]:
+    """
+    Build the first-page queries of the filtered lookups being compared.
+    """
+
+    def movies_of(association_column, entity_id: int):
+        return (
+            select(MovieModel.id, MovieModel.name)
+            .where(movie_ids_for(association_column, entity_id))
+            .order_by(MovieModel.id.desc())
+            .limit(PAGE_SIZE)
+        )
+
+    def page(*conditions, sort=MovieModel.id):
+        return (
+            select(MovieModel.id, MovieModel.name)
+            .where(*conditions)
+            .order_by(sort.desc(), MovieModel.id.desc())
+            .limit(PAGE_SIZE)
+        )
+
+    return {
+        "genre": movies_of(MoviesGenresModel.c.genre_id, 3),
+        "actor": movies_of(ActorsMoviesModel.c.actor_id, 17),
+        "language": movies_of(MoviesLanguagesModel.c.language_id, 5),
+        "country": page(MovieModel.country_id == 7),
+        "date range": page(
+            MovieModel.date.between(datetime.date(1990, 1, 1), datetime.date(1990, 12, 31)),
+            sort=MovieModel.date,
+        ),
+        "score range": page(MovieModel.score.between(90, 95), sort=MovieModel.score),
+    }
+
+
+async def explain(conn: AsyncConnection, stmt) -> str:
+    """
+    Return the plan of `stmt` as text, using the syntax of the connected backend.
+    """
+    compiled = stmt.compile(conn.sync_connection, compile_kwargs={"literal_binds": True})
+    prefix = "EXPLAIN QUERY PLAN" if conn.dialect.name == "sqlite" else "EXPLAIN"
+    result = await conn.execute(text(f"{prefix} {compiled}"))
+    if conn.dialect.name == "sqlite":
+        return "\n".join(f"    {row[-1]}" for row in result)
+    return "\n".join(f"    {row[0]}" for row in result)
+
+
+async def run(engine: AsyncEngine, label: str, repeat: int) -> None:
+    print(f"--- {label} ---")
+    async with engine.connect() as conn:
+        for name, stmt in lookup_queries().items():
+            print(f"{name}:\n{await explain(conn, stmt)}")
+            samples = await measure(lambda: conn.execute(stmt), repeat=repeat)
+            print(summarize(f"  {name}", samples))
+    print()
+
+
+async def set_indexes(engine: AsyncEngine, present: bool) -> None:
+    async with engine.begin() as conn:
+        for index in secondary_indexes():
+            if present:
+                await conn.run_sync(index.create, checkfirst=True)
+            else:
+                await conn.run_sync(index.drop, checkfirst=True)
+        await conn.execute(text("ANALYZE"))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--movies", type=int, default=100_000)
+    parser.add_argument("--actors", type=int, default=5, help="Cast size per movie")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--url", default=None, help="Async database URL (default: SQLite)")
+    args = parser.parse_args()
+
+    engine = create_benchmark_engine(args.url)
+    print(f"Seeding {args.movies} movies into {engine.url.render_as_string()}...")
+    await seed_synthetic_catalogue(engine, args.movies, actors_per_movie=args.actors)
+
+    await set_indexes(engine, present=False)
+    await run(engine, "without secondary indexes", args.repeat)
+    await set_indexes(engine, present=True)
+    await run(engine, "with secondary indexes", args.repeat)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+"""
+Compare the latency of the movie list query designs:
+
+* two round trips: COUNT(*) (or the maintained counter) followed by the page query;
+* one round trip: the page query with the total as an extra column, either a
+  `COUNT(*) OVER ()` window, a `(SELECT COUNT(*))` subquery or the counter subquery.
+
+Usage (from the `src` directory):
+
+    python -m benchmarks.list_movies --movies 200000 --repeat 200
+    BENCHMARK_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.list_movies
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.common import (
+    create_benchmark_engine,
+    measure,
+    seed_synthetic_catalogue,
+    summarize,
+)
+from database.counters import (
+    get_movies_total,
+    increment_movies_total,
+    movies_total_subquery,
+)
+from database.models import MovieModel
+
+PER_PAGE = 10
+
+
+def _page_query(offset: int):
+    return (
+        select(MovieModel)
+        .order_by(*MovieModel.default_order_by())
+        .offset(offset)
+        .limit(PER_PAGE)
+    )
+
+
+async def two_round_trips(db: AsyncSession, offset: int) -> int:
+    total = await db.scalar(select(func.count(MovieModel.id)))
+    result = await db.execute(_page_query(offset))
+    result.scalars().all()
+    return total
+
+
+async def counter_and_page(db: AsyncSession, offset: int) -> int:
+    total = await get_movies_total(db)
+    result = await db.execute(_page_query(offset))
+    result.scalars().all()
+    return total
+
+
+async def windowed_single_query(db: AsyncSession, offset: int) -> int:
+    result = await db.execute(
+        _page_query(offset).add_columns(func.count().over().label("total_items"))
+    )
+    rows = result.all()
+    return rows[0].total_items if rows else 0
+
+
+async def scalar_subquery_single_query(db: AsyncSession, offset: int) -> int:
+    total = select(func.count(MovieModel.id)).scalar_subquery().label("total_items")
+    result = await db.execute(_page_query(offset).add_columns(total))
+    rows = result.all()
+    return rows[0].total_items if rows else 0
+
+
+async def counter_subquery_single_query(db: AsyncSession, offset: int) -> int:
+    total = movies_total_subquery().label("total_items")
+    result = await db.execute(_page_query(offset).add_columns(total))
+    rows = result.all()
+    return rows[0].total_items if rows else 0
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--movies", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--url", default=None, help="Async database URL (default: SQLite)")
+    args = parser.parse_args()
+
+    engine = create_benchmark_engine(args.url)
+    print(f"Seeding {args.movies} movies into {engine.url.render_as_string()}...")
+    await seed_synthetic_catalogue(engine, args.movies, actors_per_movie=1)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as db:
+        await increment_movies_total(db, 1)
+        await db.commit()
+
+    pages = {
+        "first page": 0,
+        "middle page": (args.movies // 2 // PER_PAGE) * PER_PAGE,
+        "last page": max(args.movies - PER_PAGE, 0),
+    }
+    variants = {
+        "COUNT(*) + page (2 round trips)": two_round_trips,
+        "counter + page (2 round trips)": counter_and_page,
+        "COUNT(*) OVER () (1 round trip)": windowed_single_query,
+        "(SELECT COUNT(*)) column (1 round trip)": scalar_subquery_single_query,
+        "counter column (1 round trip)": counter_subquery_single_query,
+    }
+
+    async with session_factory() as db:
+        for page_name, offset in pages.items():
+            print(f"\n{page_name} (offset={offset})")
+            for variant_name, variant in variants.items():
+                samples = await measure(
+                    lambda: variant(db, offset), repeat=args.repeat
+                )
+                print(summarize(variant_name, samples))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""
+Compare movie detail loading strategies on movies with large casts:
+
+* joinedload of country, genres, actors and languages (one query, cartesian rows);
+* joinedload of the country and selectinload of each collection (four small queries).
+
+Usage (from the `src` directory):
+
+    python -m benchmarks.movie_detail --movies 2000 --actors 150 --repeat 200
+    BENCHMARK_DATABASE_URL=postgresql+asyncpg://... python -m benchmarks.movie_detail
+"""
+
+import argparse
+import asyncio
+import random
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import joinedload
+
+from benchmarks.common import (
+    create_benchmark_engine,
+    measure,
+    seed_synthetic_catalogue,
+    summarize,
+)
+from crud import movie_detail_loader_options
+from database.models import (
+    ActorsMoviesModel,
+    MovieModel,
+    MoviesGenresModel,
+    MoviesLanguagesModel,
+)
+from schemas.movies import MovieDetailSchema
+
+
+def joined_options() -> list:
+    return [
+        joinedload(MovieModel.country),
+        joinedload(MovieModel.genres),
+        joinedload(MovieModel.actors),
+        joinedload(MovieModel.languages),
+    ]
+
+
+async def load_detail(db: AsyncSession, movie_id: int, options: list) -> int:
+    result = await db.execute(
+        select(MovieModel).options(*options).where(MovieModel.id == movie_id)
+    )
+    movie = result.unique().scalars().one()
+    detail = MovieDetailSchema.model_validate(movie)
+    db.expunge_all()
+    return len(detail.actors)
+
+
+async def count_joined_rows(db: AsyncSession, movie_id: int) -> int:
+    """
+    Count the rows the all-joinedload query returns for one movie.
+    """
+    stmt = (
+        select(func.count())
+        .select_from(MovieModel)
+        .join(MoviesGenresModel, MoviesGenresModel.c.movie_id == MovieModel.id)
+        .join(ActorsMoviesModel, ActorsMoviesModel.c.movie_id == MovieModel.id)
+        .join(MoviesLanguagesModel, MoviesLanguagesModel.c.movie_id == MovieModel.id)
+        .where(MovieModel.id == movie_id)
+    )
+    return await db.scalar(stmt)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--movies", type=int, default=2000)
+    parser.add_argument("--actors", type=int, default=150, help="Cast size per movie")
+    parser.add_argument("--genres", type=int, default=4)
+    parser.add_argument("--languages", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--url", default=None, help="Async database URL (default: SQLite)")
+    args = parser.parse_args()
+
+    engine = create_benchmark_engine(args.url)
+    print(f"Seeding {args.movies} movies into {engine.url.render_as_string()}...")
+    await seed_synthetic_catalogue(
+        engine,
+        args.movies,
+        actors_per_movie=args.actors,
+        genres_per_movie=args.genres,
+        languages_per_movie=args.languages,
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    rng = random.Random(7)
+
+    async with session_factory() as db:
+        rows = await count_joined_rows(db, 1)
+        print(
+            f"joinedload returns {rows} rows for one movie "
+            f"({args.genres} genres x {args.actors} actors x {args.languages} languages)\n"
+        )
+
+        variants = {
+            "joinedload x4 (1 query)": joined_options(),
+            "joinedload + selectinload x3 (4 queries)": movie_detail_loader_options(),
+        }
+        for name, options in variants.items():
+            samples = await measure(
+                lambda: load_detail(db, rng.randint(1, args.movies), options),
+                repeat=args.repeat,
+            )
+            print(summarize(name, samples))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,172 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from fastapi import Response, status
+
+from config import get_settings
+
+settings = get_settings()
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that determine a representation.
+
+    :param parts: E.g. the resource kind, its id and its row version.
+    :return: A quoted entity tag.
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against the current ETag (weak comparison, RFC 9110).
+
+    :param if_none_match: The raw header value, or None if absent.
+    :param etag: The current entity tag.
+    :return: True if the client's copy is still current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def cache_headers(etag: str) -> dict:
+    """
+    Return the caching headers sent with a representation identified by `etag`.
+    """
+    return {"ETag": etag, "Cache-Control": settings.HTTP_CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Return an empty 304 response for a representation the client already has.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
+
+
+class ByteCache:
+    """
+    An in-process LRU cache of rendered response bodies with a TTL and a memory bound.
+
+    Each entry holds the ETag and the serialized bytes of one representation. The cache is
+    used from the event loop only, so no locking is needed. Every `invalidate` and `clear`
+    bumps a single generation counter, which lets a reader that awaited the database in
+    between notice that the body it rendered may already be stale (see `set`).
+    """
+
+    ENTRY_OVERHEAD = 128
+
+    def __init__(self, max_bytes: int, ttl: float) -> None:
+        """
+        :param max_bytes: Upper bound of the summed entry sizes; LRU entries are evicted above it.
+        :param ttl: Seconds after which an entry is treated as a miss.
+        """
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[str, bytes, float]]" = OrderedDict()
+        self._generation = 0
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, bytes]]:
+        """
+        Return the (etag, body) pair cached under `key`, or None on a miss or expiry.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[2] < time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def generation(self) -> int:
+        """
+        Return the number of invalidations so far; read it before loading a body to store.
+        """
+        return self._generation
+
+    def set(
+        self, key: Hashable, etag: str, body: bytes, generation: Optional[int] = None
+    ) -> None:
+        """
+        Store a representation, evicting least recently used entries to stay within bounds.
+        Bodies larger than the whole cache are not stored.
+
+        :param generation: The value of `generation()` read before the body was loaded; if
+            anything has been invalidated since, the body is discarded instead of stored.
+        """
+        if generation is not None and generation != self._generation:
+            return
+        self._remove(key)
+        size = self._entry_size(etag, body)
+        if size > self._max_bytes:
+            return
+        while self._entries and self._size + size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        self._entries[key] = (etag, body, time.monotonic() + self._ttl)
+        self._size += size
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop the entry cached under `key`, if any, and bump the generation.
+        """
+        self._generation += 1
+        self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        self._entries.clear()
+        self._size = 0
+        self._generation += 1
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the hit/miss/eviction counters and the current occupancy.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self._max_bytes,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= self._entry_size(entry[0], entry[1])
+
+    def _entry_size(self, etag: str, body: bytes) -> int:
+        return len(body) + len(etag) + self.ENTRY_OVERHEAD
+
+
+movie_detail_cache = ByteCache(
+    max_bytes=settings.MOVIE_DETAIL_CACHE_MAX_BYTES, ttl=settings.MOVIE_DETAIL_CACHE_TTL
+)
+
+
+def invalidate_movie_detail(*movie_ids: int) -> None:
+    """
+    Drop the cached detail representations of the given movies.
+    Call it after the transaction that changed them has been committed.
+    """
+    for movie_id in movie_ids:
+        movie_detail_cache.invalidate(movie_id)
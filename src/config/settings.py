@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -9,6 +9,26 @@ class BaseAppSettings(BaseSettings):
     BASE_DIR: Path = Path(__file__).parent.parent
     PATH_TO_DB: str = str(BASE_DIR / "database" / "source" / "theater.db")
     PATH_TO_MOVIES_CSV: str = str(BASE_DIR / "database" / "seed_data" / "imdb_movies.csv")
+    # Preprocessed Parquet artifacts of the movies CSV, keyed by its content hash.
+    PATH_TO_SEED_CACHE: str = str(BASE_DIR / "database" / "seed_data" / ".cache")
+    # "counter" selects the maintained movie total together with the page, "window" selects
+    # an exact COUNT(*) OVER () instead, "estimate" uses PostgreSQL planner statistics.
+    MOVIES_TOTAL_MODE: str = "counter"
+    # Sent with ETag-bearing movie responses; "no-cache" makes clients revalidate every poll.
+    HTTP_CACHE_CONTROL: str = "no-cache"
+    # In-process cache of rendered GET /movies/{id}/ bodies.
+    MOVIE_DETAIL_CACHE_ENABLED: bool = True
+    MOVIE_DETAIL_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    MOVIE_DETAIL_CACHE_TTL: float = 300.0
+    # In-process name -> id map of countries, genres and languages (and the most recent actors).
+    REFERENCE_CACHE_ENABLED: bool = True
+    REFERENCE_CACHE_MAX_ACTORS: int = 10_000
+    # Rows per chunk when the seeder streams the CSV; None loads the whole file at once.
+    SEED_CSV_CHUNK_ROWS: Optional[int] = None
+    # Merge the CSV into a populated database (new movies and associations only), and
+    # optionally overwrite changed scalar fields of existing movies.
+    SEED_INCREMENTAL: bool = False
+    SEED_UPDATE_EXISTING: bool = False
 
 
 class Settings(BaseAppSettings):
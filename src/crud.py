@@ -1,136 +1,528 @@
+from typing import Dict, Iterable, List
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.exc import IntegrityError
 from datetime import date, timedelta
 from fastapi import HTTPException, Depends
 
+from caching import invalidate_movie_detail
+from database.counters import bump_catalogue_version, increment_movies_total
+from database.dialects import dialect_insert
+from database.reference_cache import reference_cache
+from database.search import sync_search_index
+from database.stats import STATS_FIELDS, SUM_FIELDS, apply_movie_stats, apply_movie_sum_changes
+from filters import MovieListParams
 from database.models import (
     MovieModel,
     CountryModel,
     GenreModel,
     LanguageModel,
-    ActorModel)
+    ActorModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel)
 
 from schemas.movies import (
     MovieDetailSchema,
     MovieListResponseSchema,
     MovieCreateSchema,
     MovieUpdateSchema,
+    MovieBulkCreateResponseSchema,
+    MovieBulkItemResultSchema,
+    MovieBulkDeleteSchema,
+    MovieBulkDeleteResponseSchema,
 )
 
+CHUNK_SIZE = 1000
+BULK_DELETE_BATCH_SIZE = 1000
+
+
+def movie_detail_loader_options() -> list:
+    """
+    Loader options for reading a movie together with everything MovieDetailSchema needs.
+
+    The country is joined (many-to-one, one row), while each collection is fetched by its own
+    `SELECT ... WHERE movie_id IN (...)`. Joining all three collections would return
+    genres x actors x languages rows per movie, which explodes for large casts.
+    """
+    return [
+        joinedload(MovieModel.country),
+        selectinload(MovieModel.genres),
+        selectinload(MovieModel.actors),
+        selectinload(MovieModel.languages),
+    ]
 
 
 async def create_movie(db: AsyncSession, movie_data: MovieCreateSchema):
-    existing_stmt =select(MovieModel).where(
-        (MovieModel.name == movie_data.name), (MovieModel.date == movie_data.date)
+    """
+    Create a movie with its country, genres, actors and languages.
+
+    Each entity type is resolved with `_get_or_create_ids`, the movie row with an
+    INSERT ... ON CONFLICT (name, date) DO NOTHING RETURNING and each association table with
+    one multi-row INSERT, so the number of round trips does not depend on the cast size and
+    concurrent requests creating the same new actor do not collide.
+    """
+    conflict = HTTPException(
+        status_code=409, detail=f"A movie with the name '{movie_data.name}' and release date "
+                                f"'{movie_data.date}' already exists."
     )
-    result = await db.execute(existing_stmt)
-    existing_movie = result.scalars().first()
+    try:
+        country_ids = await _get_or_create_ids(db, CountryModel, "code", [movie_data.country])
+        genre_ids = await _get_or_create_ids(db, GenreModel, "name", movie_data.genres)
+        actor_ids = await _get_or_create_ids(db, ActorModel, "name", movie_data.actors)
+        language_ids = await _get_or_create_ids(db, LanguageModel, "name", movie_data.languages)
 
-    if existing_movie:
-        raise HTTPException(
-            status_code=409, detail=f"A movie with the name '{existing_movie.name}' and release date "
-                                    f"'{existing_movie.date}' already exists."
+        result = await db.execute(
+            dialect_insert(db, MovieModel)
+            .values(
+                name=movie_data.name,
+                date=movie_data.date,
+                score=movie_data.score,
+                overview=movie_data.overview,
+                status=movie_data.status,
+                budget=movie_data.budget,
+                revenue=movie_data.revenue,
+                country_id=country_ids[movie_data.country],
+            )
+            .on_conflict_do_nothing(index_elements=["name", "date"])
+            .returning(MovieModel.id)
         )
-    try:
-        country_stmt = select(CountryModel).where(CountryModel.code == movie_data.country)
-        country_result = await db.execute(country_stmt)
-        country = country_result.scalars().first()
-        if not country:
-            country = CountryModel(code=movie_data.country)
-            db.add(country)
-            await db.flush()
-
-        genres = []
-        for genre_name in movie_data.genres:
-            genre_stmt = select(GenreModel).where(GenreModel.name == genre_name)
-            genre_result = await db.execute(genre_stmt)
-            genre = genre_result.scalars().first()
-            if not genre:
-                genre = GenreModel(name=genre_name)
-                db.add(genre)
-                await db.flush()
-            genres.append(genre)
-
-        actors = []
-        for actor_name in movie_data.actors:
-            actor_stmt = select(ActorModel).where(ActorModel.name == actor_name)
-            actor_result = await db.execute(actor_stmt)
-            actor = actor_result.scalars().first()
-            if not actor:
-                actor = ActorModel(name=actor_name)
-                db.add(actor)
-                await db.flush()
-            actors.append(actor)
-
-        languages = []
-        for language_name in movie_data.languages:
-            language_stmt = select(LanguageModel).where(LanguageModel.name == language_name)
-            language_result = await db.execute(language_stmt)
-            language = language_result.scalars().first()
-            if not language:
-                language = LanguageModel(name=language_name)
-                db.add(language)
-                await db.flush()
-            languages.append(language)
-
-        new_movie = MovieModel(
-        name=movie_data.name,
-        date=movie_data.date,
-        score=movie_data.score,
-        overview=movie_data.overview,
-        status=movie_data.status,
-        budget=movie_data.budget,
-        revenue=movie_data.revenue,
-        country=country,
-        genres=genres,
-        actors=actors,
-        languages=languages,
-    )
-        db.add(new_movie)
-        await db.commit()
-        await db.refresh(new_movie, ["genres", "actors", "languages"])
+        movie_id = result.scalar_one_or_none()
+        if movie_id is None:
+            await db.rollback()
+            raise conflict
 
-        return MovieDetailSchema.model_validate(new_movie)
+        for table, column, ids in (
+            (MoviesGenresModel, "genre_id", genre_ids),
+            (ActorsMoviesModel, "actor_id", actor_ids),
+            (MoviesLanguagesModel, "language_id", language_ids),
+        ):
+            if ids:
+                await db.execute(
+                    insert(table).values(
+                        [{"movie_id": movie_id, column: entity_id} for entity_id in ids.values()]
+                    )
+                )
+
+        await apply_movie_stats(db, [movie_id], 1)
+        await increment_movies_total(db, 1)
+        await bump_catalogue_version(db)
+        await sync_search_index(db, [movie_id])
+        await db.commit()
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Invalid input data.")
+    invalidate_movie_detail(movie_id)
 
-
-
-async def update_movie(db: AsyncSession, movie_id: int, movie_update: MovieUpdateSchema):
     result = await db.execute(
         select(MovieModel)
-        .options(
-            selectinload(MovieModel.country),
-            selectinload(MovieModel.actors),
-            selectinload(MovieModel.languages),
-            selectinload(MovieModel.genres),
-        )
+        .options(*movie_detail_loader_options())
         .where(MovieModel.id == movie_id)
     )
+    return MovieDetailSchema.model_validate(result.scalars().one())
+
+
+MOVIE_ASSOCIATIONS = {
+    "genres": (GenreModel, MoviesGenresModel, "genre_id"),
+    "actors": (ActorModel, ActorsMoviesModel, "actor_id"),
+    "languages": (LanguageModel, MoviesLanguagesModel, "language_id"),
+}
+
+
+async def update_movie(db: AsyncSession, movie_id: int, movie_update: MovieUpdateSchema):
+    """
+    Apply a partial update, including the country and the genre/actor/language lists.
+
+    A given list replaces the current one: the new names are resolved with
+    `_get_or_create_ids`, compared with the current association rows, and only the
+    difference is written with one DELETE and one multi-row INSERT per association table.
+    Patches touching only scalar columns take `_update_movie_scalars` instead.
+
+    The stats rollups are rebuilt for the movie (subtracted, then added back) only when
+    it may move to other rollup rows; a change of summed columns alone shifts the sums of
+    its current rows by the difference.
+    """
+    update_data = movie_update.model_dump(exclude_unset=True)
+    relations = {
+        key: update_data.pop(key)
+        for key in ("country", *MOVIE_ASSOCIATIONS)
+        if key in update_data
+    }
+    moves_stats = not (STATS_FIELDS & {*update_data, *relations}) <= SUM_FIELDS.keys()
+    if not relations:
+        return await _update_movie_scalars(db, movie_id, update_data, moves_stats)
+
+    result = await db.execute(select(MovieModel).where(MovieModel.id == movie_id))
     movie = result.scalars().first()
     if not movie:
         raise HTTPException(status_code=404, detail="Movie with the given ID was not found.")
 
-    update_data = movie_update.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(movie, key, value)
+    try:
+        if moves_stats:
+            await apply_movie_stats(db, [movie_id], -1)
+        else:
+            await apply_movie_sum_changes(db, movie_id, _sum_values(update_data))
+        for key, value in update_data.items():
+            setattr(movie, key, value)
+        if relations.get("country") is not None:
+            country_ids = await _get_or_create_ids(db, CountryModel, "code", [relations["country"]])
+            movie.country_id = country_ids[relations["country"]]
+        movie.version = MovieModel.version + 1
 
-    db.add(movie)
-    await db.commit()
+        db.add(movie)
+        await db.flush()
+        for key, (model, table, column) in MOVIE_ASSOCIATIONS.items():
+            if relations.get(key) is not None:
+                await _replace_associations(db, movie_id, model, table, column, relations[key])
+        if moves_stats:
+            await apply_movie_stats(db, [movie_id], 1)
+        await bump_catalogue_version(db)
+        if "name" in update_data or "overview" in update_data:
+            await sync_search_index(db, [movie.id])
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid input data.")
+    invalidate_movie_detail(movie_id)
     await db.refresh(movie)
 
     return movie
 
 
-async def delete_movie_crud(db: AsyncSession, movie_id: int):
-    result = await db.execute(select(MovieModel).where(MovieModel.id == movie_id))
-    db_movie = result.scalars().first()
-    if not db_movie:
+async def _update_movie_scalars(
+    db: AsyncSession, movie_id: int, update_data: dict, moves_stats: bool
+) -> MovieModel:
+    """
+    Update scalar columns with a single UPDATE ... RETURNING, which also bumps the row
+    version and tells a missing movie (no row returned) apart without a prior SELECT.
+    The stats rollups are only touched when a rolled-up column changes, and take the full
+    subtract-then-add of `apply_movie_stats` only when the movie may move to other rows.
+    """
+    try:
+        if moves_stats:
+            await apply_movie_stats(db, [movie_id], -1)
+        else:
+            await apply_movie_sum_changes(db, movie_id, _sum_values(update_data))
+        result = await db.execute(
+            update(MovieModel)
+            .where(MovieModel.id == movie_id)
+            .values(**update_data, version=MovieModel.version + 1)
+            .returning(MovieModel)
+        )
+        movie = result.scalars().first()
+        if movie is None:
+            await db.rollback()
+            raise HTTPException(status_code=404, detail="Movie with the given ID was not found.")
+
+        if moves_stats:
+            await apply_movie_stats(db, [movie_id], 1)
+        await bump_catalogue_version(db)
+        if "name" in update_data or "overview" in update_data:
+            await sync_search_index(db, [movie_id])
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Invalid input data.")
+    invalidate_movie_detail(movie_id)
+
+    return movie
+
+
+def _sum_values(update_data: dict) -> dict:
+    """
+    Return the changed summed columns of a patch; nulls are left to the NOT NULL constraint.
+    """
+    return {
+        field: value
+        for field, value in update_data.items()
+        if field in SUM_FIELDS and value is not None
+    }
+
+
+async def _replace_associations(
+    db: AsyncSession, movie_id: int, model, table, column: str, names: List[str]
+) -> None:
+    """
+    Make the `table` rows of a movie point exactly at the entities named in `names`,
+    deleting and inserting only the rows that differ.
+    """
+    wanted = set((await _get_or_create_ids(db, model, "name", names)).values())
+    entity_column = table.c[column]
+    result = await db.execute(select(entity_column).where(table.c.movie_id == movie_id))
+    current = set(result.scalars().all())
+
+    removed = current - wanted
+    if removed:
+        await db.execute(
+            table.delete().where(table.c.movie_id == movie_id, entity_column.in_(removed))
+        )
+    added = wanted - current
+    if added:
+        await db.execute(
+            insert(table).values([{"movie_id": movie_id, column: entity_id} for entity_id in added])
+        )
+
+
+async def delete_movie_crud(db: AsyncSession, movie_id: int) -> int:
+    """
+    Delete a movie with a single DELETE ... RETURNING; association rows go with it through
+    the ON DELETE CASCADE foreign keys.
+
+    :return: The id of the deleted movie.
+    :raises HTTPException: 404 if the movie does not exist.
+    """
+    deleted_ids = await _delete_movies(db, [movie_id])
+    if not deleted_ids:
+        await db.rollback()
         raise HTTPException(status_code=404, detail="Movie with the given ID was not found.")
-    await db.delete(db_movie)
     await db.commit()
-    return {"detail": "Movie deleted successfully."}
+    invalidate_movie_detail(movie_id)
+    return movie_id
+
+
+async def bulk_delete_movies(
+    db: AsyncSession, filters: MovieBulkDeleteSchema
+) -> MovieBulkDeleteResponseSchema:
+    """
+    Delete the given movies, or every movie matching a status/date filter, in batches of
+    BULK_DELETE_BATCH_SIZE rows. Each batch is committed on its own so a large purge never
+    holds locks on `movies` and the association tables for long.
+    """
+    deleted = 0
+    if filters.ids is not None:
+        ids = list(dict.fromkeys(filters.ids))
+        for i in range(0, len(ids), BULK_DELETE_BATCH_SIZE):
+            deleted_ids = await _delete_movies(db, ids[i : i + BULK_DELETE_BATCH_SIZE])
+            await db.commit()
+            invalidate_movie_detail(*deleted_ids)
+            deleted += len(deleted_ids)
+    else:
+        params = MovieListParams(
+            status=filters.status, date_from=filters.date_from, date_to=filters.date_to
+        )
+        stmt = params.apply_filters(select(MovieModel.id)).order_by(MovieModel.id)
+        while True:
+            result = await db.execute(stmt.limit(BULK_DELETE_BATCH_SIZE))
+            deleted_ids = await _delete_movies(db, result.scalars().all())
+            await db.commit()
+            if not deleted_ids:
+                break
+            invalidate_movie_detail(*deleted_ids)
+            deleted += len(deleted_ids)
+
+    return MovieBulkDeleteResponseSchema(deleted=deleted)
+
+
+async def _delete_movies(db: AsyncSession, movie_ids: List[int]) -> List[int]:
+    """
+    Delete movies by id and update the counters and the search index in the same
+    transaction. The caller commits.
+
+    :return: The ids that existed and were deleted.
+    """
+    if not movie_ids:
+        return []
+    await apply_movie_stats(db, movie_ids, -1)
+    result = await db.execute(
+        delete(MovieModel)
+        .where(MovieModel.id.in_(movie_ids))
+        .returning(MovieModel.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_ids = list(result.scalars().all())
+    if deleted_ids:
+        await increment_movies_total(db, -len(deleted_ids))
+        await bump_catalogue_version(db)
+        await sync_search_index(db, deleted_ids)
+    return deleted_ids
+
+
+async def _get_or_create_ids(
+    db: AsyncSession, model, unique_field: str, values: Iterable[str]
+) -> Dict[str, int]:
+    """
+    Map each value of a unique column (e.g. genre names) to the id of its row, creating the
+    missing rows. Values found in the process-wide reference cache cost no query. Per chunk
+    of CHUNK_SIZE values this runs one SELECT and, only if something is missing, one
+    INSERT ... ON CONFLICT DO NOTHING RETURNING; rows inserted concurrently by another
+    transaction are skipped by the insert and picked up by a final SELECT instead of failing
+    on the unique constraint. Values are handled in sorted order, so concurrent transactions
+    take the locks of the unique index in the same order and cannot deadlock on them.
+
+    :param db: The async database session.
+    :param model: The SQLAlchemy model class (e.g. GenreModel).
+    :param unique_field: The unique column holding the values (e.g. "name").
+    :param values: The values to resolve; duplicates are ignored.
+    :return: A dict mapping every value to its row id.
+    """
+    cached, values = reference_cache.lookup(model, values)
+    values.sort()
+    column = getattr(model, unique_field)
+    ids: Dict[str, int] = {}
+
+    for i in range(0, len(values), CHUNK_SIZE):
+        chunk = values[i : i + CHUNK_SIZE]
+        result = await db.execute(select(column, model.id).where(column.in_(chunk)))
+        ids.update(result.tuples().all())
+
+        missing = [value for value in chunk if value not in ids]
+        if not missing:
+            continue
+        result = await db.execute(
+            dialect_insert(db, model)
+            .values([{unique_field: value} for value in missing])
+            .on_conflict_do_nothing(index_elements=[unique_field])
+            .returning(column, model.id)
+        )
+        ids.update(result.tuples().all())
 
+        missing = [value for value in missing if value not in ids]
+        if missing:
+            result = await db.execute(select(column, model.id).where(column.in_(missing)))
+            ids.update(result.tuples().all())
+
+    reference_cache.remember(db, model, ids)
+    return {**cached, **ids}
+
+
+async def bulk_create_movies(
+    db: AsyncSession, movies: List[MovieCreateSchema]
+) -> MovieBulkCreateResponseSchema:
+    """
+    Create many movies in one transaction with set-based statements.
+
+    Reference entities are resolved with `_get_or_create_ids`, movies are inserted with a
+    multi-row INSERT ... ON CONFLICT (name, date) DO NOTHING RETURNING, and associations with
+    multi-row INSERTs. Items that duplicate an existing movie, an earlier item of the same
+    request or a movie created concurrently are reported as conflicts instead of failing
+    the whole batch.
+    """
+    results: List[MovieBulkItemResultSchema] = [None] * len(movies)
+    first_index: Dict[tuple, int] = {}
+    for index, movie in enumerate(movies):
+        key = (movie.name, movie.date)
+        if key in first_index:
+            results[index] = MovieBulkItemResultSchema(
+                index=index,
+                status="conflict",
+                detail=f"Duplicate of item {first_index[key]} in this request.",
+            )
+        else:
+            first_index[key] = index
+
+    names = list({movie.name for movie in movies})
+    existing = set()
+    for i in range(0, len(names), CHUNK_SIZE):
+        result = await db.execute(
+            select(MovieModel.name, MovieModel.date).where(
+                MovieModel.name.in_(names[i : i + CHUNK_SIZE])
+            )
+        )
+        existing.update(result.tuples().all())
+
+    pending = []
+    for key, index in first_index.items():
+        if key in existing:
+            results[index] = _bulk_conflict(index, movies[index])
+        else:
+            pending.append(index)
+
+    created: Dict[tuple, int] = {}
+    if pending:
+        pending_movies = [movies[index] for index in pending]
+        country_ids = await _get_or_create_ids(
+            db, CountryModel, "code", (movie.country for movie in pending_movies)
+        )
+        genre_ids = await _get_or_create_ids(
+            db, GenreModel, "name", (name for movie in pending_movies for name in movie.genres)
+        )
+        actor_ids = await _get_or_create_ids(
+            db, ActorModel, "name", (name for movie in pending_movies for name in movie.actors)
+        )
+        language_ids = await _get_or_create_ids(
+            db,
+            LanguageModel,
+            "name",
+            (name for movie in pending_movies for name in movie.languages),
+        )
+
+        rows = [
+            {
+                "name": movie.name,
+                "date": movie.date,
+                "score": movie.score,
+                "overview": movie.overview,
+                "status": movie.status,
+                "budget": movie.budget,
+                "revenue": movie.revenue,
+                "country_id": country_ids[movie.country],
+            }
+            for movie in pending_movies
+        ]
+        for i in range(0, len(rows), CHUNK_SIZE):
+            result = await db.execute(
+                dialect_insert(db, MovieModel)
+                .values(rows[i : i + CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=["name", "date"])
+                .returning(MovieModel.id, MovieModel.name, MovieModel.date)
+            )
+            created.update(((name, day), movie_id) for movie_id, name, day in result.tuples())
+
+        genre_rows, actor_rows, language_rows = [], [], []
+        for movie in pending_movies:
+            movie_id = created.get((movie.name, movie.date))
+            if movie_id is None:
+                continue
+            genre_rows += [
+                {"movie_id": movie_id, "genre_id": genre_ids[name]}
+                for name in dict.fromkeys(movie.genres)
+            ]
+            actor_rows += [
+                {"movie_id": movie_id, "actor_id": actor_ids[name]}
+                for name in dict.fromkeys(movie.actors)
+            ]
+            language_rows += [
+                {"movie_id": movie_id, "language_id": language_ids[name]}
+                for name in dict.fromkeys(movie.languages)
+            ]
+        for table, association_rows in (
+            (MoviesGenresModel, genre_rows),
+            (ActorsMoviesModel, actor_rows),
+            (MoviesLanguagesModel, language_rows),
+        ):
+            for i in range(0, len(association_rows), CHUNK_SIZE):
+                await db.execute(insert(table).values(association_rows[i : i + CHUNK_SIZE]))
+
+        for index in pending:
+            movie = movies[index]
+            movie_id = created.get((movie.name, movie.date))
+            results[index] = (
+                MovieBulkItemResultSchema(index=index, status="created", id=movie_id)
+                if movie_id is not None
+                else _bulk_conflict(index, movie)
+            )
+
+    if created:
+        await apply_movie_stats(db, created.values(), 1)
+        await increment_movies_total(db, len(created))
+        await bump_catalogue_version(db)
+        await sync_search_index(db, created.values())
+    await db.commit()
+    invalidate_movie_detail(*created.values())
+
+    return MovieBulkCreateResponseSchema(
+        created=len(created),
+        conflicts=len(movies) - len(created),
+        results=results,
+    )
+
+
+def _bulk_conflict(index: int, movie: MovieCreateSchema) -> MovieBulkItemResultSchema:
+    return MovieBulkItemResultSchema(
+        index=index,
+        status="conflict",
+        detail=f"A movie with the name '{movie.name}' and release date "
+               f"'{movie.date}' already exists.",
+    )
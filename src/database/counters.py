@@ -0,0 +1,114 @@
+from sqlalchemy import func, literal, select, text, true, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.dialects import dialect_insert, dialect_name
+from database.models import CounterModel, MovieModel
+
+MOVIES_TOTAL = "movies_total"
+MOVIES_VERSION = "movies_version"
+
+
+async def get_movies_total(db: AsyncSession, approximate: bool = False) -> int:
+    """
+    Return the number of movies without scanning the movies table.
+
+    The value is read from the maintained counter row. When `approximate` is set and the
+    backend is PostgreSQL, the planner estimate from `pg_class.reltuples` is used instead;
+    it falls back to the counter while the table has not been analyzed yet.
+    If the counter row does not exist yet, the movies are counted once.
+
+    :param db: The async database session.
+    :param approximate: Whether a planner estimate is acceptable.
+    :return: The total number of movies.
+    """
+    if approximate and dialect_name(db) == "postgresql":
+        estimate = await db.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'movies'::regclass")
+        )
+        if estimate is not None and estimate > 0:
+            return estimate
+
+    total = await db.scalar(
+        select(CounterModel.value).where(CounterModel.name == MOVIES_TOTAL)
+    )
+    if total is None:
+        total = await db.scalar(select(func.count(MovieModel.id)))
+    return total
+
+
+def movies_total_subquery():
+    """
+    Return the maintained movie total as a scalar subquery, so it can be selected as an
+    extra column of another query. Evaluates to NULL while the counter row does not exist.
+    """
+    return (
+        select(CounterModel.value)
+        .where(CounterModel.name == MOVIES_TOTAL)
+        .scalar_subquery()
+    )
+
+
+async def increment_movies_total(db: AsyncSession, delta: int) -> None:
+    """
+    Adjust the maintained movie total by `delta` within the current transaction.
+
+    Must be called after the inserted or deleted movies have been flushed. If the counter
+    row is missing, it is created from an exact count, which already includes the change.
+
+    :param db: The async database session.
+    :param delta: The number of movies added (positive) or removed (negative).
+    """
+    if delta == 0:
+        return
+
+    result = await db.execute(
+        update(CounterModel)
+        .where(CounterModel.name == MOVIES_TOTAL)
+        .values(value=CounterModel.value + delta)
+    )
+    if result.rowcount == 0:
+        await db.execute(
+            dialect_insert(db, CounterModel)
+            .from_select(
+                ["name", "value"],
+                select(literal(MOVIES_TOTAL), func.count(MovieModel.id)).where(true()),
+            )
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+
+
+async def get_catalogue_version(db: AsyncSession) -> int:
+    """
+    Return the catalogue version, a number that changes whenever any movie is written.
+
+    :param db: The async database session.
+    :return: The current version, or 0 if no write has been recorded yet.
+    """
+    version = await db.scalar(
+        select(CounterModel.value).where(CounterModel.name == MOVIES_VERSION)
+    )
+    return version or 0
+
+
+async def bump_catalogue_version(db: AsyncSession) -> None:
+    """
+    Advance the catalogue version within the current transaction.
+
+    Every write to movies or their associations must call this, so that cached list
+    representations (ETags) are invalidated.
+
+    :param db: The async database session.
+    """
+    result = await db.execute(
+        update(CounterModel)
+        .where(CounterModel.name == MOVIES_VERSION)
+        .values(value=CounterModel.value + 1)
+    )
+    if result.rowcount == 0:
+        await db.execute(
+            dialect_insert(db, CounterModel)
+            .values(name=MOVIES_VERSION, value=1)
+            .on_conflict_do_update(
+                index_elements=["name"], set_={"value": CounterModel.value + 1}
+            )
+        )
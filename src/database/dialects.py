@@ -0,0 +1,27 @@
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_name(db: AsyncSession) -> str:
+    """
+    Return the name of the SQL dialect the session is bound to ("postgresql" or "sqlite").
+
+    :param db: The async database session.
+    :return: The dialect name.
+    """
+    return db.bind.dialect.name
+
+
+def dialect_insert(db: AsyncSession, table):
+    """
+    Build an INSERT construct for the session's backend, so callers can use
+    `on_conflict_do_nothing` / `on_conflict_do_update` on both PostgreSQL and SQLite.
+
+    :param db: The async database session.
+    :param table: The SQLAlchemy table or model to insert into.
+    :return: A dialect-specific Insert construct.
+    """
+    if dialect_name(db) == "postgresql":
+        return postgresql_insert(table)
+    return sqlite_insert(table)
@@ -21,6 +21,14 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Database objects managed only by migrations (not mapped on the models),
+# which autogenerate must not try to drop.
+SKIPPED_OBJECTS = {"search_vector", "ix_movies_search_vector"}
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return name not in SKIPPED_OBJECTS
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -48,6 +56,7 @@ def run_migrations_offline() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -69,6 +78,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,30 @@
+"""add movie version
+
+Revision ID: 0d6a9b3e58f1
+Revises: c31d8f05e7a2
+Create Date: 2026-10-18 12:40:55.107263
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0d6a9b3e58f1"
+down_revision: Union[str, None] = "c31d8f05e7a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "movies",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("movies", "version")
@@ -0,0 +1,36 @@
+"""add counters table
+
+Revision ID: 5b7c2e91d4a3
+Revises: ea3a65568bd9
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7c2e91d4a3"
+down_revision: Union[str, None] = "ea3a65568bd9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "counters",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(
+        "INSERT INTO counters (name, value) "
+        "SELECT 'movies_total', count(*) FROM movies"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("counters")
@@ -0,0 +1,61 @@
+"""add movie stats table
+
+Revision ID: 7f2c4d9a1e63
+Revises: 0d6a9b3e58f1
+Create Date: 2026-10-18 15:21:09.734112
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f2c4d9a1e63"
+down_revision: Union[str, None] = "0d6a9b3e58f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SUMS = "count(*), sum(m.score), sum(m.budget), sum(m.revenue)"
+COLUMNS = "(dimension, key, movie_count, score_sum, budget_sum, revenue_sum)"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "movie_stats",
+        sa.Column("dimension", sa.String(length=16), nullable=False),
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("movie_count", sa.BigInteger(), nullable=False),
+        sa.Column("score_sum", sa.Float(), nullable=False),
+        sa.Column("budget_sum", sa.DECIMAL(precision=20, scale=2), nullable=False),
+        sa.Column("revenue_sum", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("dimension", "key"),
+    )
+    op.execute(
+        f"INSERT INTO movie_stats {COLUMNS} "
+        f"SELECT 'genre', g.name, {SUMS} FROM movies m "
+        "JOIN movies_genres mg ON mg.movie_id = m.id "
+        "JOIN genres g ON g.id = mg.genre_id GROUP BY g.name"
+    )
+    op.execute(
+        f"INSERT INTO movie_stats {COLUMNS} "
+        "SELECT 'year', CAST(CAST(EXTRACT(YEAR FROM m.date) AS INTEGER) AS VARCHAR), "
+        f"{SUMS} FROM movies m "
+        "GROUP BY CAST(CAST(EXTRACT(YEAR FROM m.date) AS INTEGER) AS VARCHAR)"
+    )
+    op.execute(
+        f"INSERT INTO movie_stats {COLUMNS} "
+        f"SELECT 'country', c.code, {SUMS} FROM movies m "
+        "JOIN countries c ON c.id = m.country_id GROUP BY c.code"
+    )
+    op.execute(
+        f"INSERT INTO movie_stats {COLUMNS} "
+        f"SELECT 'status', CAST(m.status AS VARCHAR), {SUMS} FROM movies m "
+        "GROUP BY CAST(m.status AS VARCHAR)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("movie_stats")
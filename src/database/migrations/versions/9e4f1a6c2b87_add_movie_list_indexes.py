@@ -0,0 +1,60 @@
+"""add movie list indexes
+
+Revision ID: 9e4f1a6c2b87
+Revises: 5b7c2e91d4a3
+Create Date: 2026-10-18 11:04:27.918340
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4f1a6c2b87"
+down_revision: Union[str, None] = "5b7c2e91d4a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_movies_score_id", "movies", ["score", "id"], unique=False)
+    op.create_index("ix_movies_date_id", "movies", ["date", "id"], unique=False)
+    op.create_index("ix_movies_revenue_id", "movies", ["revenue", "id"], unique=False)
+    op.create_index("ix_movies_name_id", "movies", ["name", "id"], unique=False)
+    op.create_index(
+        "ix_movies_country_id_id", "movies", ["country_id", "id"], unique=False
+    )
+    op.create_index("ix_movies_status_id", "movies", ["status", "id"], unique=False)
+    op.create_index(
+        "ix_movies_genres_genre_id_movie_id",
+        "movies_genres",
+        ["genre_id", "movie_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_actors_movies_actor_id_movie_id",
+        "actors_movies",
+        ["actor_id", "movie_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_movies_languages_language_id_movie_id",
+        "movies_languages",
+        ["language_id", "movie_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_movies_languages_language_id_movie_id", table_name="movies_languages")
+    op.drop_index("ix_actors_movies_actor_id_movie_id", table_name="actors_movies")
+    op.drop_index("ix_movies_genres_genre_id_movie_id", table_name="movies_genres")
+    op.drop_index("ix_movies_status_id", table_name="movies")
+    op.drop_index("ix_movies_country_id_id", table_name="movies")
+    op.drop_index("ix_movies_name_id", table_name="movies")
+    op.drop_index("ix_movies_revenue_id", table_name="movies")
+    op.drop_index("ix_movies_date_id", table_name="movies")
+    op.drop_index("ix_movies_score_id", table_name="movies")
@@ -0,0 +1,45 @@
+"""add movie search vector
+
+Revision ID: c31d8f05e7a2
+Revises: 9e4f1a6c2b87
+Create Date: 2026-10-18 11:52:09.216734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c31d8f05e7a2"
+down_revision: Union[str, None] = "9e4f1a6c2b87"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Generated column, so PostgreSQL keeps it in sync on every INSERT/UPDATE.
+    # It is intentionally not mapped on MovieModel (see SKIPPED_OBJECTS in env.py).
+    op.execute(
+        """
+        ALTER TABLE movies ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(name, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(overview, '')), 'B')
+        ) STORED
+        """
+    )
+    op.create_index(
+        "ix_movies_search_vector",
+        "movies",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_movies_search_vector", table_name="movies")
+    op.drop_column("movies", "search_vector")
@@ -3,6 +3,8 @@ from enum import Enum
 from typing import Optional
 
 from sqlalchemy import (
+    DDL,
+    BigInteger,
     String,
     Float,
     Text,
@@ -10,8 +12,11 @@ from sqlalchemy import (
     UniqueConstraint,
     Date,
     ForeignKey,
+    Index,
+    Integer,
     Table,
     Column,
+    event,
 )
 from sqlalchemy.orm import DeclarativeBase, mapped_column, Mapped, relationship
 from sqlalchemy import Enum as SQLAlchemyEnum
@@ -44,6 +49,7 @@ MoviesGenresModel = Table(
         primary_key=True,
         nullable=False,
     ),
+    Index("ix_movies_genres_genre_id_movie_id", "genre_id", "movie_id"),
 )
 
 ActorsMoviesModel = Table(
@@ -61,6 +67,7 @@ ActorsMoviesModel = Table(
         primary_key=True,
         nullable=False,
     ),
+    Index("ix_actors_movies_actor_id_movie_id", "actor_id", "movie_id"),
 )
 
 MoviesLanguagesModel = Table(
@@ -70,6 +77,7 @@ MoviesLanguagesModel = Table(
     Column(
         "language_id", ForeignKey("languages.id", ondelete="CASCADE"), primary_key=True
     ),
+    Index("ix_movies_languages_language_id_movie_id", "language_id", "movie_id"),
 )
 
 
@@ -143,6 +151,9 @@ class MovieModel(Base):
     )
     budget: Mapped[float] = mapped_column(DECIMAL(15, 2), nullable=False)
     revenue: Mapped[float] = mapped_column(Float, nullable=False)
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
 
     country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"), nullable=False)
     country: Mapped["CountryModel"] = relationship(
@@ -161,7 +172,17 @@ class MovieModel(Base):
         "LanguageModel", secondary=MoviesLanguagesModel, back_populates="movies"
     )
 
-    __table_args__ = (UniqueConstraint("name", "date", name="unique_movie_constraint"),)
+    __table_args__ = (
+        UniqueConstraint("name", "date", name="unique_movie_constraint"),
+        Index("ix_movies_score_id", "score", "id"),
+        Index("ix_movies_date_id", "date", "id"),
+        Index("ix_movies_revenue_id", "revenue", "id"),
+        Index("ix_movies_name_id", "name", "id"),
+        Index("ix_movies_country_id_id", "country_id", "id"),
+        Index("ix_movies_status_id", "status", "id"),
+        # Never reuse the id of a deleted movie: detail ETags are built from (id, version).
+        {"sqlite_autoincrement": True},
+    )
 
     @classmethod
     def default_order_by(cls):
@@ -169,3 +190,49 @@ class MovieModel(Base):
 
     def __repr__(self):
         return f"<Movie(name='{self.name}', release_date='{self.date}', score={self.score})>"
+
+
+# Full-text index of movie names and overviews for the SQLite backend (FTS5, rowid = movie id).
+# On PostgreSQL the same role is played by the generated `movies.search_vector` column,
+# which is created by a migration; see database/search.py.
+event.listen(
+    MovieModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS movies_fts USING fts5(name, overview)"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    MovieModel.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS movies_fts").execute_if(dialect="sqlite"),
+)
+
+
+class CounterModel(Base):
+    __tablename__ = "counters"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<Counter(name='{self.name}', value={self.value})>"
+
+
+class MovieStatModel(Base):
+    """
+    Rollup of movie count and score/budget/revenue sums per genre, release year, country
+    and status; maintained incrementally by database/stats.py.
+    """
+
+    __tablename__ = "movie_stats"
+
+    dimension: Mapped[str] = mapped_column(String(16), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    movie_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    score_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    budget_sum: Mapped[float] = mapped_column(DECIMAL(20, 2), nullable=False, default=0)
+    revenue_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<MovieStat(dimension='{self.dimension}', key='{self.key}', count={self.movie_count})>"
@@ -1,9 +1,14 @@
 import asyncio
+import hashlib
 import math
-from typing import List, Dict, Tuple
+import os
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import insert, select
+from sqlalchemy import insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from tqdm import tqdm
@@ -18,26 +23,73 @@ from database.models import (
     LanguageModel,
     MoviesLanguagesModel,
     MovieModel,
+    MovieStatusEnum,
 )
 from database import get_db_contextmanager
+from database.dialects import dialect_insert, dialect_name
+from database.counters import bump_catalogue_version, increment_movies_total
+from database.search import sync_search_index
+from database.stats import apply_movie_stats
 
 CHUNK_SIZE = 1000
 
+# Part of the preprocessed artifact key; bump it whenever `_clean_frame` changes its output.
+PREPROCESS_VERSION = 1
+
+# Scalar movie fields compared (and, if enabled, overwritten) by the incremental mode.
+MOVIE_UPDATE_FIELDS = ("score", "overview", "status", "budget", "revenue", "country_id")
+
+MOVIE_COPY_COLUMNS = (
+    "id", "name", "date", "score", "overview", "status", "budget", "revenue", "country_id"
+)
+
+
+def split_column(column: pd.Series) -> pd.Series:
+    """
+    Split a column of comma-separated names into one row per name, keeping the index of
+    the originating row. Names are stripped and empty names are dropped.
+
+    :param column: A string column such as "Drama, Action".
+    :return: A Series of single names indexed like `column`.
+    """
+    names = column.str.split(",").explode().str.strip()
+    return names[names.notna() & (names != "")]
+
 
 class CSVDatabaseSeeder:
     """
     A class responsible for seeding the database from a CSV file using asynchronous SQLAlchemy.
     """
 
-    def __init__(self, csv_file_path: str, db_session: AsyncSession) -> None:
+    def __init__(
+        self,
+        csv_file_path: str,
+        db_session: AsyncSession,
+        chunk_rows: Optional[int] = None,
+        incremental: bool = False,
+        update_existing: bool = False,
+        cache_dir: Optional[str] = None,
+    ) -> None:
         """
         Initialize the seeder with the path to the CSV file and an async database session.
 
         :param csv_file_path: The path to the CSV file containing movie data.
         :param db_session: An instance of AsyncSession for performing database operations.
+        :param chunk_rows: When set, stream the CSV in chunks of this many rows, inserting and
+                           committing each chunk before reading the next (see `_seed_streaming`).
+        :param incremental: Merge the CSV into a populated database instead of loading it into
+                            an empty one (see `_upsert_frame`).
+        :param update_existing: In incremental mode, also overwrite changed scalar fields of
+                                movies that already exist.
+        :param cache_dir: Directory for the preprocessed Parquet artifact of the CSV; when None,
+                          the CSV is parsed and cleaned on every run.
         """
         self._csv_file_path = csv_file_path
         self._db_session = db_session
+        self._chunk_rows = chunk_rows
+        self._incremental = incremental
+        self._update_existing = update_existing
+        self._cache_dir = cache_dir
 
     async def is_db_populated(self) -> bool:
         """
@@ -52,13 +104,72 @@ class CSVDatabaseSeeder:
     def _preprocess_csv(self) -> pd.DataFrame:
         """
         Load the CSV, remove duplicates, convert relevant columns to strings, and clean up data.
-        Saves the cleaned CSV back to the same path, then returns the Pandas DataFrame.
+
+        The source CSV is never modified. With a cache directory, the cleaned frame is stored
+        as a Parquet artifact keyed by the content hash of the CSV, and later runs on the same
+        file load that artifact instead of parsing and cleaning the CSV again.
 
         :return: A Pandas DataFrame containing cleaned movie data.
         """
+        artifact = self._artifact_path()
+        if artifact is not None and artifact.exists():
+            print(f"Loading preprocessed data from {artifact}")
+            return pd.read_parquet(artifact)
+
+        print("Preprocessing CSV file...")
         data = pd.read_csv(self._csv_file_path)
         data = data.drop_duplicates(subset=["names", "date_x"], keep="first")
+        data = self._clean_frame(data).reset_index(drop=True)
+
+        if artifact is not None:
+            artifact.parent.mkdir(parents=True, exist_ok=True)
+            partial = artifact.with_suffix(f".{os.getpid()}.tmp")
+            data.to_parquet(partial, index=False)
+            os.replace(partial, artifact)
+            print(f"Preprocessed data saved to {artifact}")
+        return data
 
+    def _artifact_path(self) -> Optional[Path]:
+        """
+        Return the path of the preprocessed artifact for the current content of the CSV,
+        or None if caching is disabled.
+        """
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha256(f"v{PREPROCESS_VERSION}:".encode())
+        with open(self._csv_file_path, "rb") as source:
+            for block in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(block)
+        stem = Path(self._csv_file_path).stem
+        return Path(self._cache_dir) / f"{stem}-{digest.hexdigest()[:32]}.parquet"
+
+    def _iter_csv_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Read the CSV in chunks of `chunk_rows` rows and yield each one cleaned and without
+        movies already seen in this file.
+
+        Seen movies are remembered as 64-bit hashes of (name, date) rather than the strings
+        themselves, so the key set stays small next to the data it deduplicates.
+
+        :return: An iterator of cleaned DataFrames.
+        """
+        seen: Set[int] = set()
+        for chunk in pd.read_csv(self._csv_file_path, chunksize=self._chunk_rows):
+            keys = pd.util.hash_pandas_object(chunk[["names", "date_x"]], index=False)
+            duplicated = keys.duplicated() | keys.isin(seen)
+            seen.update(keys[~duplicated].tolist())
+            chunk = chunk[~duplicated.to_numpy()]
+            if not chunk.empty:
+                yield self._clean_frame(chunk)
+
+    def _clean_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert relevant columns to strings and clean up the values of a CSV frame.
+
+        :param data: Raw rows read from the CSV.
+        :return: The cleaned DataFrame.
+        """
+        data = data.copy()
         for col in ["crew", "genre", "country", "orig_lang", "status"]:
             data[col] = data[col].fillna("Unknown").astype(str)
 
@@ -78,10 +189,6 @@ class CSVDatabaseSeeder:
         data["date_x"] = data["date_x"].dt.date
         data["orig_lang"] = data["orig_lang"].str.replace(r"\s+", "", regex=True)
         data["status"] = data["status"].str.strip()
-
-        print("Preprocessing CSV file...")
-        data.to_csv(self._csv_file_path, index=False)
-        print(f"CSV file saved to {self._csv_file_path}")
         return data
 
     async def _get_or_create_bulk(
@@ -132,24 +239,92 @@ class CSVDatabaseSeeder:
 
         return existing_dict
 
-    async def _bulk_insert(self, table, data_list: List[Dict[str, int]]) -> None:
+    async def _copy_records(self, table_name: str, columns, records) -> None:
+        """
+        Stream records into a PostgreSQL table with asyncpg's binary COPY, inside the
+        session's current transaction.
+
+        :param table_name: The table to load.
+        :param columns: The column names, in record order.
+        :param records: An iterable of tuples.
         """
-        Insert data_list into the given table in chunks, displaying progress via tqdm.
+        connection = await self._db_session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table_name, records=records, columns=list(columns)
+        )
+
+    async def _insert_movies(self, movies_data: List[Dict[str, object]]) -> List[int]:
+        """
+        Insert the movie rows and return their ids in row order.
+
+        On PostgreSQL the ids are taken from the sequence up front and the rows are loaded
+        with COPY; elsewhere a multi-row INSERT ... RETURNING is used.
+
+        :param movies_data: The rows built by `_prepare_movies_data`.
+        :return: The new movie ids, in the same order as `movies_data`.
+        """
+        if not movies_data:
+            return []
+        if dialect_name(self._db_session) != "postgresql":
+            result = await self._db_session.execute(
+                insert(MovieModel).returning(MovieModel.id, sort_by_parameter_order=True),
+                movies_data,
+            )
+            return list(result.scalars().all())
+
+        result = await self._db_session.execute(
+            text(
+                "SELECT nextval(pg_get_serial_sequence('movies', 'id')) "
+                "FROM generate_series(1, :count)"
+            ),
+            {"count": len(movies_data)},
+        )
+        movie_ids = list(result.scalars().all())
+        records = [
+            (
+                movie_id,
+                movie["name"],
+                movie["date"],
+                movie["score"],
+                movie["overview"],
+                MovieStatusEnum(movie["status"]).name,
+                Decimal(str(movie["budget"])),
+                movie["revenue"],
+                movie["country_id"],
+            )
+            for movie_id, movie in zip(movie_ids, movies_data)
+        ]
+        print(f"Copying {len(records)} rows into movies...")
+        await self._copy_records(MovieModel.__tablename__, MOVIE_COPY_COLUMNS, records)
+        return movie_ids
+
+    async def _bulk_insert(self, table, data_list: pd.DataFrame) -> None:
+        """
+        Insert data_list into the given table, with a single COPY on PostgreSQL and in
+        chunks of INSERT statements elsewhere, displaying progress via tqdm.
 
         :param table: The SQLAlchemy table or model to insert into.
-        :param data_list: A list of dictionaries, where each dict represents a row to insert.
+        :param data_list: A DataFrame whose columns are the table columns to insert.
         """
         total_records = len(data_list)
         if total_records == 0:
             return
 
+        if dialect_name(self._db_session) == "postgresql":
+            table_name = getattr(table, "__tablename__", getattr(table, "name", str(table)))
+            print(f"Copying {total_records} rows into {table_name}...")
+            records = [tuple(row) for row in data_list.to_numpy().tolist()]
+            await self._copy_records(table_name, data_list.columns, records)
+            return
+
         num_chunks = math.ceil(total_records / CHUNK_SIZE)
         table_name = getattr(table, "__tablename__", str(table))
 
         for chunk_index in tqdm(range(num_chunks), desc=f"Inserting into {table_name}"):
             start = chunk_index * CHUNK_SIZE
             end = start + CHUNK_SIZE
-            chunk = data_list[start:end]
+            chunk = data_list.iloc[start:end].to_dict("records")
             if chunk:
                 await self._db_session.execute(insert(table).values(chunk))
 
@@ -169,31 +344,14 @@ class CSVDatabaseSeeder:
                  (country_map, genre_map, actor_map, language_map).
         """
         countries = list(data["country"].unique())
-        genres = {
-            genre.strip()
-            for genres_ in data["genre"].dropna()
-            for genre in genres_.split(",")
-            if genre.strip()
-        }
-        actors = {
-            actor.strip()
-            for crew in data["crew"].dropna()
-            for actor in crew.split(",")
-            if actor.strip()
-        }
-        languages = {
-            lang.strip()
-            for langs in data["orig_lang"].dropna()
-            for lang in langs.split(",")
-            if lang.strip()
-        }
+        genres = split_column(data["genre"].dropna()).unique().tolist()
+        actors = split_column(data["crew"].dropna()).unique().tolist()
+        languages = split_column(data["orig_lang"].dropna()).unique().tolist()
 
         country_map = await self._get_or_create_bulk(CountryModel, countries, "code")
-        genre_map = await self._get_or_create_bulk(GenreModel, list(genres), "name")
-        actor_map = await self._get_or_create_bulk(ActorModel, list(actors), "name")
-        language_map = await self._get_or_create_bulk(
-            LanguageModel, list(languages), "name"
-        )
+        genre_map = await self._get_or_create_bulk(GenreModel, genres, "name")
+        actor_map = await self._get_or_create_bulk(ActorModel, actors, "name")
+        language_map = await self._get_or_create_bulk(LanguageModel, languages, "name")
 
         return country_map, genre_map, actor_map, language_map
 
@@ -202,28 +360,26 @@ class CSVDatabaseSeeder:
     ) -> List[Dict[str, object]]:
         """
         Build a list of dictionaries representing movie records to be inserted into MovieModel.
+        The columns are converted as a whole, with the country code mapped to its id.
 
         :param data: The preprocessed DataFrame.
         :param country_map: A mapping of country codes to CountryModel instances.
         :return: A list of dictionaries, each representing a new movie record.
         """
-        movies_data: List[Dict[str, object]] = []
-        for _, row in tqdm(
-            data.iterrows(), total=data.shape[0], desc="Processing movies"
-        ):
-            country = country_map[row["country"]]
-            movie = {
-                "name": row["names"],
-                "date": row["date_x"],
-                "score": float(row["score"]),
-                "overview": row["overview"],
-                "status": row["status"],
-                "budget": float(row["budget_x"]),
-                "revenue": float(row["revenue"]),
-                "country_id": country.id,
+        country_ids = {code: country.id for code, country in country_map.items()}
+        movies = pd.DataFrame(
+            {
+                "name": data["names"],
+                "date": data["date_x"],
+                "score": data["score"].astype(float),
+                "overview": data["overview"],
+                "status": data["status"],
+                "budget": data["budget_x"].astype(float),
+                "revenue": data["revenue"].astype(float),
+                "country_id": data["country"].map(country_ids),
             }
-            movies_data.append(movie)
-        return movies_data
+        )
+        return movies.to_dict("records")
 
     def _prepare_associations(
         self,
@@ -232,110 +388,283 @@ class CSVDatabaseSeeder:
         genre_map: Dict[str, object],
         actor_map: Dict[str, object],
         language_map: Dict[str, object],
-    ) -> Tuple[List[Dict[str, int]], List[Dict[str, int]], List[Dict[str, int]]]:
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
-        Prepare three lists of dictionaries: movie-genre, movie-actor, and movie-language
-        associations for all movies in the DataFrame.
+        Prepare the movie-genre, movie-actor and movie-language association rows for all
+        movies in the DataFrame. Each list column is split and exploded into one row per
+        (movie, entity) pair and the names are mapped to ids column-wise.
 
         :param data: The DataFrame containing movie info.
         :param movie_ids: The list of newly inserted movie IDs, in the same order as DataFrame rows.
         :param genre_map: A mapping of genre names to GenreModel instances.
         :param actor_map: A mapping of actor names to ActorModel instances.
         :param language_map: A mapping of language names to LanguageModel instances.
-        :return: A tuple of three lists:
+        :return: A tuple of three DataFrames:
                  (movie_genres_data, movie_actors_data, movie_languages_data),
-                 each containing dictionaries for bulk insertion.
-        """
-        movie_genres_data: List[Dict[str, int]] = []
-        movie_actors_data: List[Dict[str, int]] = []
-        movie_languages_data: List[Dict[str, int]] = []
-
-        for i, (_, row) in enumerate(
-            tqdm(data.iterrows(), total=data.shape[0], desc="Processing associations")
-        ):
-            movie_id = movie_ids[i]
-
-            for genre_name in row["genre"].split(","):
-                genre_name = genre_name.strip()
-                if genre_name:
-                    genre = genre_map[genre_name]
-                    movie_genres_data.append(
-                        {"movie_id": movie_id, "genre_id": genre.id}
-                    )
-
-            for actor_name in row["crew"].split(","):
-                actor_name = actor_name.strip()
-                if actor_name:
-                    actor = actor_map[actor_name]
-                    movie_actors_data.append(
-                        {"movie_id": movie_id, "actor_id": actor.id}
-                    )
-
-            for lang_name in row["orig_lang"].split(","):
-                lang_name = lang_name.strip()
-                if lang_name:
-                    language = language_map[lang_name]
-                    movie_languages_data.append(
-                        {"movie_id": movie_id, "language_id": language.id}
-                    )
-
-        return movie_genres_data, movie_actors_data, movie_languages_data
+                 with a `movie_id` and an entity id column each.
+        """
+        movie_ids = np.asarray(movie_ids)
+
+        def associations(column: str, id_column: str, entity_map: Dict[str, object]):
+            names = split_column(
+                pd.Series(data[column].to_numpy(), index=np.arange(len(data)), name=column)
+            )
+            entity_ids = names.map({name: entity.id for name, entity in entity_map.items()})
+            rows = pd.DataFrame(
+                {"movie_id": movie_ids[names.index.to_numpy()], id_column: entity_ids.to_numpy()}
+            )
+            return rows.drop_duplicates(ignore_index=True)
+
+        return (
+            associations("genre", "genre_id", genre_map),
+            associations("crew", "actor_id", actor_map),
+            associations("orig_lang", "language_id", language_map),
+        )
 
     async def seed(self) -> None:
         """
         Main method to seed the database with movie data from the CSV.
         It pre-processes the CSV, prepares reference data (countries, genres, actors, languages),
         inserts all movies, then inserts many-to-many relationships (genres, actors, languages).
+        With `chunk_rows` set, this happens chunk by chunk instead (see `_seed_streaming`).
         """
         try:
             if self._db_session.in_transaction():
                 print("Rolling back existing transaction.")
                 await self._db_session.rollback()
 
-            data = self._preprocess_csv()
+            if self._chunk_rows:
+                await self._seed_streaming()
+            else:
+                await self._seed_frame(self._preprocess_csv())
+                await self._db_session.commit()
+            print("Seeding completed.")
 
-            country_map, genre_map, actor_map, language_map = (
-                await self._prepare_reference_data(data)
-            )
+        except SQLAlchemyError as e:
+            print(f"An error occurred: {e}")
+            raise
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            raise
 
-            movies_data = self._prepare_movies_data(data, country_map)
+    async def _seed_streaming(self) -> None:
+        """
+        Seed the CSV chunk by chunk, committing after each one, so peak memory is bounded by
+        `chunk_rows` rather than by the size of the file. The cleaned CSV is not written back
+        in this mode. A failure leaves the chunks committed before it in place.
+        """
+        total = 0
+        for index, data in enumerate(self._iter_csv_chunks(), start=1):
+            total += await self._seed_frame(data)
+            await self._db_session.commit()
+            self._db_session.expunge_all()
+            print(f"Chunk {index} committed ({total} movies so far).")
 
-            result = await self._db_session.execute(
-                insert(MovieModel).returning(MovieModel.id), movies_data
+    async def _seed_frame(self, data: pd.DataFrame) -> int:
+        """
+        Insert the movies of a cleaned DataFrame with their reference data and associations,
+        and update the counters, search index and stats. The caller commits.
+
+        :param data: A DataFrame produced by `_clean_frame`.
+        :return: The number of inserted movies.
+        """
+        if self._incremental:
+            return await self._upsert_frame(data)
+
+        country_map, genre_map, actor_map, language_map = (
+            await self._prepare_reference_data(data)
+        )
+
+        movies_data = self._prepare_movies_data(data, country_map)
+
+        movie_ids = await self._insert_movies(movies_data)
+        await increment_movies_total(self._db_session, len(movie_ids))
+        await bump_catalogue_version(self._db_session)
+        await sync_search_index(self._db_session, movie_ids)
+
+        movie_genres_data, movie_actors_data, movie_languages_data = (
+            self._prepare_associations(
+                data, movie_ids, genre_map, actor_map, language_map
             )
-            movie_ids = list(result.scalars().all())
+        )
 
-            movie_genres_data, movie_actors_data, movie_languages_data = (
+        await self._bulk_insert(MoviesGenresModel, movie_genres_data)
+        await self._bulk_insert(ActorsMoviesModel, movie_actors_data)
+        await self._bulk_insert(MoviesLanguagesModel, movie_languages_data)
+        await apply_movie_stats(self._db_session, movie_ids, 1)
+        return len(movie_ids)
+
+    async def _upsert_frame(self, data: pd.DataFrame) -> int:
+        """
+        Merge a cleaned DataFrame into a populated database, writing only what changed.
+
+        Movies are matched on the (name, date) unique constraint. New movies are inserted;
+        existing ones are upserted with INSERT ... ON CONFLICT (name, date) DO UPDATE, and only
+        when `update_existing` is set and one of MOVIE_UPDATE_FIELDS differs. Association rows
+        missing from the database are added; rows absent from the CSV are left alone.
+        Counters, search index, stats and row versions are updated for the touched movies
+        only. The caller commits.
+
+        :param data: A DataFrame produced by `_clean_frame`.
+        :return: The number of inserted or updated movies.
+        """
+        country_map, genre_map, actor_map, language_map = (
+            await self._prepare_reference_data(data)
+        )
+        movies_data = self._prepare_movies_data(data, country_map)
+        existing = await self._fetch_existing_movies(movies_data)
+
+        existing_ids = np.zeros(len(movies_data), dtype=np.int64)
+        new_positions: List[int] = []
+        changed_rows: List[Dict[str, object]] = []
+        changed_ids: Set[int] = set()
+        for position, movie in enumerate(movies_data):
+            current = existing.get((movie["name"], movie["date"]))
+            if current is None:
+                new_positions.append(position)
+                continue
+            existing_ids[position] = current["id"]
+            if self._update_existing and _movie_changed(current, movie):
+                changed_rows.append(movie)
+                changed_ids.add(current["id"])
+
+        tables = (MoviesGenresModel, ActorsMoviesModel, MoviesLanguagesModel)
+        missing = [
+            await self._missing_associations(table, rows[rows["movie_id"] != 0])
+            for table, rows in zip(
+                tables,
                 self._prepare_associations(
-                    data, movie_ids, genre_map, actor_map, language_map
+                    data, existing_ids, genre_map, actor_map, language_map
+                ),
+            )
+        ]
+        touched = sorted(
+            changed_ids.union(*(rows["movie_id"].tolist() for rows in missing))
+        )
+
+        await apply_movie_stats(self._db_session, touched, -1)
+        for i in range(0, len(changed_rows), CHUNK_SIZE):
+            stmt = dialect_insert(self._db_session, MovieModel).values(
+                changed_rows[i : i + CHUNK_SIZE]
+            )
+            await self._db_session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["name", "date"],
+                    set_={field: getattr(stmt.excluded, field) for field in MOVIE_UPDATE_FIELDS},
                 )
             )
+        for i in range(0, len(touched), CHUNK_SIZE):
+            await self._db_session.execute(
+                update(MovieModel)
+                .where(MovieModel.id.in_(touched[i : i + CHUNK_SIZE]))
+                .values(version=MovieModel.version + 1)
+                .execution_options(synchronize_session=False)
+            )
 
-            await self._bulk_insert(MoviesGenresModel, movie_genres_data)
-            await self._bulk_insert(ActorsMoviesModel, movie_actors_data)
-            await self._bulk_insert(MoviesLanguagesModel, movie_languages_data)
+        new_ids = await self._insert_movies([movies_data[position] for position in new_positions])
+        if new_ids:
+            missing = [
+                pd.concat([rows, new_rows], ignore_index=True)
+                for rows, new_rows in zip(
+                    missing,
+                    self._prepare_associations(
+                        data.iloc[new_positions], new_ids, genre_map, actor_map, language_map
+                    ),
+                )
+            ]
+        for table, rows in zip(tables, missing):
+            await self._bulk_insert(table, rows)
+
+        written = [*touched, *new_ids]
+        await apply_movie_stats(self._db_session, written, 1)
+        if written:
+            await increment_movies_total(self._db_session, len(new_ids))
+            await bump_catalogue_version(self._db_session)
+            await sync_search_index(self._db_session, written)
+        print(
+            f"Inserted {len(new_ids)} movies, updated {len(changed_rows)}, "
+            f"added associations to {len(touched) - len(changed_ids)} more."
+        )
+        return len(new_ids) + len(changed_rows)
 
-            await self._db_session.commit()
-            print("Seeding completed.")
+    async def _fetch_existing_movies(
+        self, movies_data: List[Dict[str, object]]
+    ) -> Dict[Tuple[str, object], Dict[str, object]]:
+        """
+        Load the id and the comparable fields of the movies that already exist, keyed by
+        (name, date).
+        """
+        names = list({movie["name"] for movie in movies_data})
+        existing: Dict[Tuple[str, object], Dict[str, object]] = {}
+        columns = [getattr(MovieModel, field) for field in ("id", "name", "date", *MOVIE_UPDATE_FIELDS)]
+        for i in range(0, len(names), CHUNK_SIZE):
+            result = await self._db_session.execute(
+                select(*columns).where(MovieModel.name.in_(names[i : i + CHUNK_SIZE]))
+            )
+            for row in result.mappings():
+                existing[(row["name"], row["date"])] = dict(row)
+        return existing
 
-        except SQLAlchemyError as e:
-            print(f"An error occurred: {e}")
-            raise
-        except Exception as e:
-            print(f"Unexpected error: {e}")
-            raise
+    async def _missing_associations(self, table, rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return the association rows (of existing movies) that are not in `table` yet.
+
+        :param table: The association table.
+        :param rows: Candidate rows with a `movie_id` and an entity id column.
+        :return: The subset of `rows` to insert.
+        """
+        if rows.empty:
+            return rows.reset_index(drop=True)
+        present = []
+        movie_ids = [int(movie_id) for movie_id in rows["movie_id"].unique()]
+        for i in range(0, len(movie_ids), CHUNK_SIZE):
+            result = await self._db_session.execute(
+                select(*(table.c[column] for column in rows.columns)).where(
+                    table.c.movie_id.in_(movie_ids[i : i + CHUNK_SIZE])
+                )
+            )
+            present.extend(result.tuples().all())
+        merged = rows.merge(
+            pd.DataFrame(present, columns=rows.columns, dtype=np.int64),
+            how="left",
+            indicator=True,
+        )
+        return merged[merged["_merge"] == "left_only"].drop(columns="_merge").reset_index(drop=True)
+
+
+def _movie_changed(current: Dict[str, object], movie: Dict[str, object]) -> bool:
+    """
+    Tell whether a CSV movie row differs from the stored one in any MOVIE_UPDATE_FIELDS.
+    """
+    for field in MOVIE_UPDATE_FIELDS:
+        stored, incoming = current[field], movie[field]
+        if field == "status":
+            incoming = MovieStatusEnum(incoming)
+        elif field == "budget":
+            stored, incoming = Decimal(stored), Decimal(str(incoming)).quantize(Decimal("0.01"))
+        if stored != incoming:
+            return True
+    return False
 
 
 async def main() -> None:
     """
     The main async entry point for running the database seeder.
     Checks if the database is already populated, and if not, performs the seeding process.
+    With SEED_INCREMENTAL enabled, the CSV is merged into the database even if it is populated.
     """
     settings = get_settings()
     async with get_db_contextmanager() as db_session:
-        seeder = CSVDatabaseSeeder(settings.PATH_TO_MOVIES_CSV, db_session)
+        seeder = CSVDatabaseSeeder(
+            settings.PATH_TO_MOVIES_CSV,
+            db_session,
+            chunk_rows=settings.SEED_CSV_CHUNK_ROWS,
+            incremental=settings.SEED_INCREMENTAL,
+            update_existing=settings.SEED_UPDATE_EXISTING,
+            cache_dir=settings.PATH_TO_SEED_CACHE,
+        )
 
-        if not await seeder.is_db_populated():
+        if settings.SEED_INCREMENTAL or not await seeder.is_db_populated():
             try:
                 await seeder.seed()
                 print("Database seeding completed successfully.")
@@ -0,0 +1,136 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, MutableMapping, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database.models import ActorModel, CountryModel, GenreModel, LanguageModel
+
+settings = get_settings()
+
+PENDING_KEY = "reference_cache_pending"
+
+# Unique column holding the cache key of each reference table.
+REFERENCE_FIELDS = {
+    CountryModel.__tablename__: "code",
+    GenreModel.__tablename__: "name",
+    LanguageModel.__tablename__: "name",
+    ActorModel.__tablename__: "name",
+}
+
+
+class ReferenceCache:
+    """
+    A process-wide map from the unique name (or code) of reference rows to their ids.
+
+    Countries, genres and languages are small and almost static, so they are cached in full;
+    actors are many, so they are kept in an LRU bounded by `max_actors`. Ids are only added
+    once the transaction that read or created them has committed (see `remember`), so a
+    rolled-back insert never leaves a dangling id behind. Reference rows are never deleted
+    by the API, which is what makes entries valid until `clear`.
+    """
+
+    def __init__(self, max_actors: int, enabled: bool = True) -> None:
+        """
+        :param max_actors: Upper bound of cached actor names; LRU entries are evicted above it.
+        :param enabled: When False every lookup misses and nothing is stored.
+        """
+        self.enabled = enabled
+        self._max_actors = max_actors
+        self._maps: Dict[str, MutableMapping[str, int]] = {
+            CountryModel.__tablename__: {},
+            GenreModel.__tablename__: {},
+            LanguageModel.__tablename__: {},
+            ActorModel.__tablename__: OrderedDict(),
+        }
+
+    def get(self, model, value: str) -> Optional[int]:
+        """
+        Return the cached id of the `model` row identified by `value`, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        table = model.__tablename__
+        mapping = self._maps[table]
+        entity_id = mapping.get(value)
+        if entity_id is not None and table == ActorModel.__tablename__:
+            mapping.move_to_end(value)
+        return entity_id
+
+    def lookup(self, model, values: Iterable[str]) -> Tuple[Dict[str, int], List[str]]:
+        """
+        Split `values` into the cached ones (with their ids) and the ones still to be resolved.
+
+        :return: A (found, missing) pair; duplicates in `values` are ignored.
+        """
+        found: Dict[str, int] = {}
+        missing: List[str] = []
+        for value in dict.fromkeys(values):
+            entity_id = self.get(model, value)
+            if entity_id is None:
+                missing.append(value)
+            else:
+                found[value] = entity_id
+        return found, missing
+
+    def put(self, table: str, ids: Dict[str, int]) -> None:
+        """
+        Store committed name -> id pairs of a reference table.
+        """
+        if not self.enabled:
+            return
+        mapping = self._maps[table]
+        mapping.update(ids)
+        if table == ActorModel.__tablename__:
+            for value in ids:
+                mapping.move_to_end(value)
+            while len(mapping) > self._max_actors:
+                mapping.popitem(last=False)
+
+    def remember(self, db: AsyncSession, model, ids: Dict[str, int]) -> None:
+        """
+        Queue ids read or created in the current transaction; they are stored on commit
+        and dropped on rollback.
+        """
+        if self.enabled and ids:
+            pending = db.info.setdefault(PENDING_KEY, [])
+            pending.append((model.__tablename__, dict(ids)))
+
+    async def load(self, db: AsyncSession) -> None:
+        """
+        Warm the cache with every country, genre and language (actors are cached lazily).
+        """
+        if not self.enabled:
+            return
+        for model in (CountryModel, GenreModel, LanguageModel):
+            column = getattr(model, REFERENCE_FIELDS[model.__tablename__])
+            result = await db.execute(select(column, model.id))
+            self.put(model.__tablename__, dict(result.tuples().all()))
+
+    def clear(self) -> None:
+        """
+        Drop all entries, e.g. after the database has been recreated.
+        """
+        for mapping in self._maps.values():
+            mapping.clear()
+
+    def __len__(self) -> int:
+        return sum(len(mapping) for mapping in self._maps.values())
+
+
+reference_cache = ReferenceCache(
+    max_actors=settings.REFERENCE_CACHE_MAX_ACTORS, enabled=settings.REFERENCE_CACHE_ENABLED
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_references(session: Session) -> None:
+    for table, ids in session.info.pop(PENDING_KEY, ()):
+        reference_cache.put(table, ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_references(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
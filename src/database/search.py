@@ -0,0 +1,75 @@
+import re
+from typing import Iterable, Optional
+
+from sqlalchemy import Select, column, delete, func, insert, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.dialects import dialect_name
+from database.models import MovieModel
+
+CHUNK_SIZE = 1000
+SEARCH_CONFIG = "english"
+
+movies_fts = table("movies_fts", column("rowid"), column("name"), column("overview"))
+
+
+async def sync_search_index(db: AsyncSession, movie_ids: Iterable[int]) -> None:
+    """
+    Bring the full-text index in line with the current rows of the given movies.
+
+    Call it after the movies were inserted, updated or deleted (and flushed), in the same
+    transaction. On SQLite the matching `movies_fts` rows are replaced (deleted movies simply
+    drop out). On PostgreSQL `movies.search_vector` is a generated column, so there is
+    nothing to do.
+
+    :param db: The async database session.
+    :param movie_ids: Ids of the movies that changed.
+    """
+    if dialect_name(db) != "sqlite":
+        return
+
+    movie_ids = list(movie_ids)
+    for i in range(0, len(movie_ids), CHUNK_SIZE):
+        chunk = movie_ids[i : i + CHUNK_SIZE]
+        await db.execute(delete(movies_fts).where(movies_fts.c.rowid.in_(chunk)))
+        await db.execute(
+            insert(movies_fts).from_select(
+                ["rowid", "name", "overview"],
+                select(MovieModel.id, MovieModel.name, MovieModel.overview).where(
+                    MovieModel.id.in_(chunk)
+                ),
+            )
+        )
+
+
+def search_movies_statement(db: AsyncSession, query: str) -> Optional[Select]:
+    """
+    Build a statement selecting the movies matching `query`, best matches first.
+
+    PostgreSQL matches `websearch_to_tsquery` against the GIN-indexed `search_vector` and
+    ranks with `ts_rank_cd`; SQLite matches the FTS5 table and ranks with `bm25`. In both
+    cases name matches weigh more than overview matches.
+
+    :param db: The async database session.
+    :param query: The user's search text.
+    :return: A select statement over MovieModel, or None if the text has no searchable words.
+    """
+    if dialect_name(db) == "postgresql":
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        search_vector = literal_column("movies.search_vector")
+        return (
+            select(MovieModel)
+            .where(search_vector.op("@@")(ts_query))
+            .order_by(func.ts_rank_cd(search_vector, ts_query).desc(), MovieModel.id.desc())
+        )
+
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    match = " ".join(f'"{term}"' for term in terms) + "*"
+    return (
+        select(MovieModel)
+        .join(movies_fts, movies_fts.c.rowid == MovieModel.id)
+        .where(literal_column("movies_fts").op("MATCH")(match))
+        .order_by(func.bm25(literal_column("movies_fts"), 10.0, 1.0), MovieModel.id.desc())
+    )
@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
@@ -11,6 +12,19 @@ settings = get_settings()
 
 SQLITE_DATABASE_URL = f"sqlite+aiosqlite:///{settings.PATH_TO_DB}"
 sqlite_engine = create_async_engine(SQLITE_DATABASE_URL, echo=False)
+
+
+@event.listens_for(sqlite_engine.sync_engine, "connect")
+def _enable_foreign_keys(dbapi_connection, connection_record) -> None:
+    """
+    SQLite ignores foreign keys unless enabled per connection; without them deleting a movie
+    would leave its association rows behind instead of cascading like on PostgreSQL.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 AsyncSQLiteSessionLocal = sessionmaker(  # type: ignore
     bind=sqlite_engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -0,0 +1,150 @@
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import Integer, String, cast, delete, func, literal, select, tuple_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.dialects import dialect_insert
+from database.models import (
+    CountryModel,
+    GenreModel,
+    MovieModel,
+    MovieStatModel,
+    MoviesGenresModel,
+)
+
+CHUNK_SIZE = 1000
+
+STATS_DIMENSIONS = ("genre", "year", "country", "status")
+
+# Movie fields whose change moves a movie between rollup rows or changes their sums.
+STATS_FIELDS = {"score", "budget", "revenue", "date", "status", "country", "genres"}
+
+# Movie fields that only feed the sums: changing them never moves a movie to another row.
+SUM_FIELDS = {"score": "score_sum", "budget": "budget_sum", "revenue": "revenue_sum"}
+
+
+def _dimension_source(dimension: str) -> Tuple[object, object]:
+    """
+    Return the (key expression, FROM clause) grouping movies by `dimension`.
+    """
+    if dimension == "genre":
+        source = MovieModel.__table__.join(
+            MoviesGenresModel, MoviesGenresModel.c.movie_id == MovieModel.id
+        ).join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+        return GenreModel.name, source
+    if dimension == "year":
+        year = cast(cast(func.extract("year", MovieModel.date), Integer), String)
+        return year, MovieModel.__table__
+    if dimension == "country":
+        source = MovieModel.__table__.join(CountryModel, CountryModel.id == MovieModel.country_id)
+        return CountryModel.code, source
+    return cast(MovieModel.status, String), MovieModel.__table__
+
+
+async def apply_movie_stats(db: AsyncSession, movie_ids: Iterable[int], sign: int) -> None:
+    """
+    Add (sign=1) or subtract (sign=-1) the current rows of the given movies to the rollups.
+
+    Call it with -1 before a change and with 1 after it, in the same transaction. Each
+    dimension is one INSERT ... SELECT ... GROUP BY ... ON CONFLICT DO UPDATE per chunk of
+    movie ids, so the cost depends on the number of changed movies, not the catalogue size.
+
+    The rollups are hot rows: every write to a movie of, say, the same year or genre updates
+    the same `movie_stats` row and holds its lock until commit, so concurrent writers of
+    related movies are serialized on it. That is the price of constant-time stats reads.
+    The grouped rows are inserted in (dimension, key) order so that the row locks of one
+    statement are always taken in the same order and two such statements cannot deadlock
+    each other; a deadlock is still possible across statements (e.g. two transactions
+    moving movies between the same two genres in opposite directions), in which case
+    PostgreSQL aborts one of them.
+
+    The float sums (`score_sum`, `budget_sum`, `revenue_sum`) are maintained by repeated
+    additions and subtractions and accumulate rounding drift over time; recompute them from
+    `movies`, as the migration that created the table does, if exact totals are needed.
+
+    :param db: The async database session.
+    :param movie_ids: Ids of the movies being created, changed or deleted.
+    :param sign: 1 to add the movies, -1 to remove them.
+    """
+    movie_ids = list(movie_ids)
+    for i in range(0, len(movie_ids), CHUNK_SIZE):
+        chunk = movie_ids[i : i + CHUNK_SIZE]
+        for dimension in STATS_DIMENSIONS:
+            key, source = _dimension_source(dimension)
+            rows = (
+                select(
+                    literal(dimension),
+                    key,
+                    func.count() * sign,
+                    func.sum(MovieModel.score) * sign,
+                    func.sum(MovieModel.budget) * sign,
+                    func.sum(MovieModel.revenue) * sign,
+                )
+                .select_from(source)
+                .where(MovieModel.id.in_(chunk))
+                .group_by(key)
+                .order_by(key)
+            )
+            stmt = dialect_insert(db, MovieStatModel).from_select(
+                ["dimension", "key", "movie_count", "score_sum", "budget_sum", "revenue_sum"],
+                rows,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["dimension", "key"],
+                set_={
+                    name: getattr(MovieStatModel, name) + getattr(stmt.excluded, name)
+                    for name in ("movie_count", "score_sum", "budget_sum", "revenue_sum")
+                },
+            )
+            await db.execute(stmt)
+
+    if sign < 0 and movie_ids:
+        await db.execute(delete(MovieStatModel).where(MovieStatModel.movie_count <= 0))
+
+
+async def apply_movie_sum_changes(db: AsyncSession, movie_id: int, values: Dict[str, object]) -> None:
+    """
+    Shift the sums of every rollup row of one movie from its current column values to
+    `values`. Call it before the movie row itself is updated, in the same transaction.
+
+    Used instead of the -1/+1 pair of `apply_movie_stats` when a change touches only
+    SUM_FIELDS: the movie stays in the same rows, so one UPDATE covers all dimensions.
+    The current values are read with FOR UPDATE, so concurrent changes of the same movie
+    are serialized and each one shifts the sums by its own difference.
+
+    :param db: The async database session.
+    :param movie_id: Id of the changed movie.
+    :param values: New value per changed field of SUM_FIELDS.
+    """
+    if not values:
+        return
+    keys = []
+    for dimension in STATS_DIMENSIONS:
+        key, source = _dimension_source(dimension)
+        keys.append(
+            select(literal(dimension), key).select_from(source).where(MovieModel.id == movie_id)
+        )
+    changes = {}
+    for field, value in values.items():
+        column = getattr(MovieModel, field)
+        current = select(column).where(MovieModel.id == movie_id).with_for_update()
+        delta = literal(value, column.type) - current.scalar_subquery()
+        changes[SUM_FIELDS[field]] = getattr(MovieStatModel, SUM_FIELDS[field]) + delta
+    await db.execute(
+        update(MovieStatModel)
+        .where(tuple_(MovieStatModel.dimension, MovieStatModel.key).in_(union_all(*keys)))
+        .values(changes)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_movie_stats(db: AsyncSession, dimension: str) -> List[MovieStatModel]:
+    """
+    Return the rollup rows of one dimension ordered by their group key.
+    """
+    result = await db.execute(
+        select(MovieStatModel)
+        .where(MovieStatModel.dimension == dimension)
+        .order_by(MovieStatModel.key)
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,249 @@
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import HTTPException, Query
+from sqlalchemy import and_, func, or_, select
+
+from database.models import (
+    ActorModel,
+    ActorsMoviesModel,
+    CountryModel,
+    GenreModel,
+    LanguageModel,
+    MovieModel,
+    MovieStatusEnum,
+    MoviesGenresModel,
+    MoviesLanguagesModel,
+)
+from database.reference_cache import reference_cache
+from pagination import encode_cursor
+
+MOVIE_SORT_COLUMNS = {
+    "id": MovieModel.id,
+    "score": MovieModel.score,
+    "date": MovieModel.date,
+    "revenue": MovieModel.revenue,
+    "name": MovieModel.name,
+}
+
+
+@dataclass
+class MovieListParams:
+    """
+    Filters and sort order of the movies list.
+
+    Every filter resolves the referenced entity to its id first (from the reference cache
+    when possible, otherwise with a scalar subquery), so it is answered from
+    the `(entity_id, movie_id)` association indexes or the `(column, id)` indexes on
+    `movies`; every sort key has a matching `(column, id)` index.
+    """
+
+    genre: Optional[str] = None
+    actor: Optional[str] = None
+    language: Optional[str] = None
+    country: Optional[str] = None
+    status: Optional[MovieStatusEnum] = None
+    date_from: Optional[datetime.date] = None
+    date_to: Optional[datetime.date] = None
+    score_min: Optional[float] = None
+    score_max: Optional[float] = None
+    sort: str = "id"
+    order: str = "desc"
+
+    @property
+    def has_filters(self) -> bool:
+        return any(
+            value is not None
+            for value in (
+                self.genre,
+                self.actor,
+                self.language,
+                self.country,
+                self.status,
+                self.date_from,
+                self.date_to,
+                self.score_min,
+                self.score_max,
+            )
+        )
+
+    def apply_filters(self, stmt):
+        """
+        Add the WHERE clauses of all given filters to a statement selecting from movies.
+
+        :param stmt: A select statement over MovieModel.
+        :return: The filtered statement.
+        """
+        if self.genre is not None:
+            genre_id = _entity_id(GenreModel, GenreModel.name, self.genre)
+            stmt = stmt.where(movie_ids_for(MoviesGenresModel.c.genre_id, genre_id))
+        if self.actor is not None:
+            actor_id = _entity_id(ActorModel, ActorModel.name, self.actor)
+            stmt = stmt.where(movie_ids_for(ActorsMoviesModel.c.actor_id, actor_id))
+        if self.language is not None:
+            language_id = _entity_id(LanguageModel, LanguageModel.name, self.language)
+            stmt = stmt.where(movie_ids_for(MoviesLanguagesModel.c.language_id, language_id))
+        if self.country is not None:
+            stmt = stmt.where(
+                MovieModel.country_id == _entity_id(CountryModel, CountryModel.code, self.country)
+            )
+        if self.status is not None:
+            stmt = stmt.where(MovieModel.status == self.status)
+        if self.date_from is not None:
+            stmt = stmt.where(MovieModel.date >= self.date_from)
+        if self.date_to is not None:
+            stmt = stmt.where(MovieModel.date <= self.date_to)
+        if self.score_min is not None:
+            stmt = stmt.where(MovieModel.score >= self.score_min)
+        if self.score_max is not None:
+            stmt = stmt.where(MovieModel.score <= self.score_max)
+        return stmt
+
+    def count_statement(self):
+        """
+        Build a statement counting the movies that match the filters.
+        """
+        return self.apply_filters(select(func.count(MovieModel.id)))
+
+    def order_by(self, reverse: bool = False) -> List[Any]:
+        """
+        Return the ORDER BY clauses of the list: the sort key, then `id` as a tie-breaker.
+
+        :param reverse: Walk the list backwards (used when paging to a previous cursor).
+        """
+        descending = (self.order == "desc") != reverse
+        columns = [MOVIE_SORT_COLUMNS[self.sort]] if self.sort != "id" else []
+        columns.append(MovieModel.id)
+        return [column.desc() if descending else column.asc() for column in columns]
+
+    def seek(self, position: Dict[str, Any]):
+        """
+        Build the keyset condition selecting the rows after (or before) a cursor position.
+
+        :param position: A decoded cursor produced by `cursor`.
+        :return: A SQL boolean expression.
+        :raises HTTPException: 400 if the cursor was issued for another sort order.
+        """
+        if position.get("sort", "id") != self.sort or position.get("order", "desc") != self.order:
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+        descending = (self.order == "desc") == (position["dir"] == "next")
+        last_id = position["id"]
+        id_condition = MovieModel.id < last_id if descending else MovieModel.id > last_id
+        if self.sort == "id":
+            return id_condition
+
+        column = MOVIE_SORT_COLUMNS[self.sort]
+        value = self._parse_key(position.get("key"))
+        key_condition = column < value if descending else column > value
+        return or_(key_condition, and_(column == value, id_condition))
+
+    def cursor(self, movie: MovieModel, direction: str) -> str:
+        """
+        Encode the position of `movie` in this list as an opaque cursor.
+
+        :param movie: The first or last movie of the current page.
+        :param direction: "next" or "prev".
+        """
+        payload: Dict[str, Any] = {"id": movie.id, "dir": direction}
+        if self.sort != "id" or self.order != "desc":
+            payload["sort"] = self.sort
+            payload["order"] = self.order
+        if self.sort != "id":
+            value = getattr(movie, self.sort)
+            payload["key"] = value.isoformat() if self.sort == "date" else value
+        return encode_cursor(payload)
+
+    def query_params(self) -> Dict[str, str]:
+        """
+        Return the non-default filter and sort parameters, for building page links.
+        """
+        params = {}
+        for name in (
+            "genre",
+            "actor",
+            "language",
+            "country",
+            "status",
+            "date_from",
+            "date_to",
+            "score_min",
+            "score_max",
+        ):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if isinstance(value, MovieStatusEnum):
+                value = value.value
+            elif isinstance(value, datetime.date):
+                value = value.isoformat()
+            params[name] = str(value)
+        if self.sort != "id":
+            params["sort"] = self.sort
+        if self.order != "desc":
+            params["order"] = self.order
+        return params
+
+    def _parse_key(self, value: Any) -> Any:
+        try:
+            if self.sort == "date":
+                return datetime.date.fromisoformat(value)
+            if self.sort == "name":
+                if not isinstance(value, str):
+                    raise ValueError
+                return value
+            return float(value)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def _entity_id(model, unique_column, value: str):
+    entity_id = reference_cache.get(model, value)
+    if entity_id is not None:
+        return entity_id
+    return select(model.id).where(unique_column == value).scalar_subquery()
+
+
+def movie_ids_for(association_column, entity_id):
+    """
+    Return a condition matching the movies linked to one genre, actor or language.
+
+    :param association_column: The entity column of the association table,
+        e.g. `MoviesGenresModel.c.genre_id`.
+    :param entity_id: The entity id, or a scalar subquery resolving it.
+    """
+    return MovieModel.id.in_(
+        select(association_column.table.c.movie_id).where(association_column == entity_id)
+    )
+
+
+def movie_list_params(
+    genre: Optional[str] = Query(None, description="Only movies with this genre name."),
+    actor: Optional[str] = Query(None, description="Only movies with this actor name."),
+    language: Optional[str] = Query(None, description="Only movies in this language."),
+    country: Optional[str] = Query(None, max_length=3, description="Country code."),
+    status: Optional[MovieStatusEnum] = Query(None),
+    date_from: Optional[datetime.date] = Query(None),
+    date_to: Optional[datetime.date] = Query(None),
+    score_min: Optional[float] = Query(None, ge=0, le=100),
+    score_max: Optional[float] = Query(None, ge=0, le=100),
+    sort: Literal["id", "score", "date", "revenue", "name"] = Query("id"),
+    order: Literal["asc", "desc"] = Query("desc"),
+) -> MovieListParams:
+    """
+    FastAPI dependency collecting the filter and sort query parameters of the movies list.
+    """
+    return MovieListParams(
+        genre=genre,
+        actor=actor,
+        language=language,
+        country=country,
+        status=status,
+        date_from=date_from,
+        date_to=date_to,
+        score_min=score_min,
+        score_max=score_max,
+        sort=sort,
+        order=order,
+    )
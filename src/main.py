@@ -1,15 +1,43 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
+from sqlalchemy.exc import SQLAlchemyError
+
+from database import get_db_contextmanager
+from database.reference_cache import reference_cache
+from routes import entity_router, movie_router, stats_router
+
+logger = logging.getLogger(__name__)
+
 
-from routes import movie_router
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the reference-data cache before serving requests. If the schema does not exist yet,
+    the cache is filled lazily instead.
+    """
+    try:
+        async with get_db_contextmanager() as db:
+            await reference_cache.load(db)
+    except SQLAlchemyError:
+        logger.warning("Could not warm the reference cache; it will be filled lazily.")
+    yield
 
 
-app = FastAPI(title="Movies homework", description="Description of project")
+app = FastAPI(title="Movies homework", description="Description of project", lifespan=lifespan)
 
 api_version_prefix = "/api/v1"
 
 app.include_router(
     movie_router, prefix=f"{api_version_prefix}/theater", tags=["theater"]
 )
+app.include_router(
+    entity_router, prefix=f"{api_version_prefix}/theater", tags=["theater"]
+)
+app.include_router(
+    stats_router, prefix=f"{api_version_prefix}/theater", tags=["theater"]
+)
 
 add_pagination(app)
@@ -1,3 +1,9 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+from fastapi import HTTPException
 from fastapi_pagination import Page, Params
 from pydantic import Field
 
@@ -5,3 +11,37 @@ from pydantic import Field
 class CustomParams(Params):
     page: int = Field(1, ge=1, le=20)
     per_page: int = Field(10, ge=1, le=20)
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor string.
+
+    :param payload: The position to encode, e.g. {"id": 42, "dir": "next"}.
+    :return: A base64url string without padding.
+    """
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    :param cursor: The opaque cursor string received from the client.
+    :return: The decoded position.
+    :raises HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    if (
+        not isinstance(payload, dict)
+        or not isinstance(payload.get("id"), int)
+        or payload.get("dir") not in ("next", "prev")
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    return payload
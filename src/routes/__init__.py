@@ -1 +1,3 @@
 from routes.movies import router as movie_router
+from routes.entities import router as entity_router
+from routes.stats import router as stats_router
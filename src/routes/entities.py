@@ -0,0 +1,152 @@
+from typing import Optional
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db, MovieModel
+from database.models import (
+    ActorModel,
+    ActorsMoviesModel,
+    CountryModel,
+    GenreModel,
+    LanguageModel,
+    MoviesGenresModel,
+    MoviesLanguagesModel,
+)
+from filters import MovieListParams, movie_ids_for
+from pagination import decode_cursor
+from schemas.movies import EntityMoviesResponseSchema, MovieListItemSchema
+
+router = APIRouter()
+
+
+async def _entity_movies(
+    db: AsyncSession,
+    model,
+    condition,
+    entity_id: int,
+    path: str,
+    cursor: Optional[str],
+    per_page: int,
+) -> EntityMoviesResponseSchema:
+    """
+    Return one keyset page of the movies matching `condition`, newest id first.
+
+    The condition is an IN-subquery on the `(entity_id, movie_id)` association index (or the
+    `(country_id, id)` index), and the page seeks past the cursor id with one extra row to
+    detect whether another page exists, so deep pages cost the same as the first one.
+
+    :raises HTTPException: 404 if the entity does not exist, 400 for a malformed cursor.
+    """
+    if await db.get(model, entity_id) is None:
+        raise HTTPException(
+            status_code=404, detail=f"{model.__name__.removesuffix('Model')} not found."
+        )
+
+    params = MovieListParams()
+    forward = True
+    stmt = select(MovieModel).where(condition)
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        forward = position["dir"] == "next"
+        stmt = stmt.where(params.seek(position))
+    stmt = stmt.order_by(*params.order_by(reverse=not forward)).limit(per_page + 1)
+
+    result = await db.execute(stmt)
+    movies = list(result.scalars().all())
+    has_more = len(movies) > per_page
+    movies = movies[:per_page]
+    if not forward:
+        movies.reverse()
+
+    has_prev = cursor is not None if forward else has_more
+    has_next = has_more if forward else True
+    prev_cursor = params.cursor(movies[0], "prev") if movies and has_prev else None
+    next_cursor = params.cursor(movies[-1], "next") if movies and has_next else None
+
+    def link(page_cursor: Optional[str]) -> Optional[str]:
+        if page_cursor is None:
+            return None
+        return f"{path}?{urlencode({'per_page': per_page, 'cursor': page_cursor})}"
+
+    return EntityMoviesResponseSchema(
+        movies=[MovieListItemSchema.model_validate(movie) for movie in movies],
+        prev_page=link(prev_cursor),
+        next_page=link(next_cursor),
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/actors/{actor_id}/movies/", response_model=EntityMoviesResponseSchema)
+async def get_actor_movies(
+    actor_id: int,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page."),
+    per_page: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_db),
+):
+    return await _entity_movies(
+        db,
+        ActorModel,
+        movie_ids_for(ActorsMoviesModel.c.actor_id, actor_id),
+        actor_id,
+        f"/theater/actors/{actor_id}/movies/",
+        cursor,
+        per_page,
+    )
+
+
+@router.get("/genres/{genre_id}/movies/", response_model=EntityMoviesResponseSchema)
+async def get_genre_movies(
+    genre_id: int,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page."),
+    per_page: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_db),
+):
+    return await _entity_movies(
+        db,
+        GenreModel,
+        movie_ids_for(MoviesGenresModel.c.genre_id, genre_id),
+        genre_id,
+        f"/theater/genres/{genre_id}/movies/",
+        cursor,
+        per_page,
+    )
+
+
+@router.get("/languages/{language_id}/movies/", response_model=EntityMoviesResponseSchema)
+async def get_language_movies(
+    language_id: int,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page."),
+    per_page: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_db),
+):
+    return await _entity_movies(
+        db,
+        LanguageModel,
+        movie_ids_for(MoviesLanguagesModel.c.language_id, language_id),
+        language_id,
+        f"/theater/languages/{language_id}/movies/",
+        cursor,
+        per_page,
+    )
+
+
+@router.get("/countries/{country_id}/movies/", response_model=EntityMoviesResponseSchema)
+async def get_country_movies(
+    country_id: int,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page."),
+    per_page: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_db),
+):
+    return await _entity_movies(
+        db,
+        CountryModel,
+        MovieModel.country_id == country_id,
+        country_id,
+        f"/theater/countries/{country_id}/movies/",
+        cursor,
+        per_page,
+    )
@@ -1,25 +1,63 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status, Response
-from sqlalchemy import select, func
+import csv
+import io
+import json
+from functools import lru_cache
+from typing import AsyncIterator, List, Literal, Optional, Tuple, Type
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status, Response
+from sqlalchemy import JSON, select, func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi_pagination import Page, add_pagination, paginate
+from pydantic import BaseModel, TypeAdapter
 
-from pagination import CustomParams
-from database import get_db, MovieModel
-from database.models import CountryModel, GenreModel, ActorModel, LanguageModel
+from caching import cache_headers, etag_matches, make_etag, movie_detail_cache, not_modified
+from config import get_settings
+from filters import MOVIE_SORT_COLUMNS, MovieListParams, movie_list_params
+from pagination import CustomParams, decode_cursor
+from database import get_db, get_db_contextmanager, MovieModel
+from database.counters import get_catalogue_version, get_movies_total, movies_total_subquery
+from database.search import search_movies_statement
+from database.dialects import dialect_name
+from database.models import (
+    CountryModel,
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    MoviesGenresModel,
+    ActorsMoviesModel,
+    MoviesLanguagesModel,
+)
 from schemas.movies import (
     MovieDetailSchema,
     MovieListResponseSchema,
     MovieCreateSchema,
     MovieUpdateSchema,
-    MovieListItemSchema
+    MovieListItemSchema,
+    MovieSearchResponseSchema,
+    CacheStatsSchema,
+    MovieBatchResponseSchema,
+    MovieBulkCreateSchema,
+    MovieBulkCreateResponseSchema,
+    MovieBulkDeleteSchema,
+    MovieBulkDeleteResponseSchema,
+)
+from crud import (
+    bulk_create_movies,
+    bulk_delete_movies,
+    create_movie,
+    update_movie,
+    delete_movie_crud,
+    movie_detail_loader_options,
 )
-from crud import create_movie, update_movie, delete_movie_crud
-
-from src.schemas.movies import MovieListItemSchema
 
 router = APIRouter()
+settings = get_settings()
+
+MOVIE_RELATIONSHIPS = ("country", "genres", "actors", "languages")
 
 
 @router.get("/movies/",
@@ -34,60 +72,468 @@ router = APIRouter()
     },
 )
 async def list_movies(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),
     per_page: int = Query(10, ge=1, le=20),
+    cursor: Optional[str] = Query(None),
+    params: MovieListParams = Depends(movie_list_params),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated subset of movie fields, e.g. `id,name,score`."
+    ),
+    if_none_match: Optional[str] = Header(None),
 ):
-    offset = (page - 1) * per_page
-    count_movies = select(func.count(MovieModel.id))
-    total_items = await db.scalar(count_movies)
-    if total_items == 0:
-        raise HTTPException(status_code=404, detail="No movies found.")
+    field_names = _parse_fields(fields, MovieListItemSchema)
+    fields = _join(field_names)
+    etag = make_etag(
+        "movies",
+        await get_catalogue_version(db),
+        sorted(request.query_params.multi_items()),
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers.update(cache_headers(etag))
 
-    order_by = MovieModel.default_order_by()
-    stmt = select(MovieModel)
-    if order_by:
-        stmt =stmt.order_by(*order_by)
-    stmt = stmt.offset(offset).limit(per_page)
+    stmt = params.apply_filters(select(MovieModel))
+    if field_names:
+        stmt = stmt.options(
+            load_only(
+                *(getattr(MovieModel, name) for name in field_names),
+                MOVIE_SORT_COLUMNS[params.sort],
+            )
+        )
 
-    result = await db.execute(stmt)
-    movies = result.scalars().all()
+    if cursor is not None:
+        # A filtered total is a full COUNT over the matches; it is only reported on the
+        # first (offset) page, so that seeking deeper keeps a flat cost.
+        total_items = total_pages = None
+        if not params.has_filters:
+            total_items = await _get_total_items(db, params)
+            total_pages = (total_items + per_page - 1) // per_page
+        response = await _list_movies_by_cursor(
+            db, stmt, params, cursor, per_page, total_items, total_pages, field_names
+        )
+        return _render_sparse(response, field_names, etag)
 
-    if not movies:
-        raise HTTPException(status_code=404, detail="No movies found.")
-    movie_list = [MovieListItemSchema.model_validate(movie) for movie in movies]
+    offset = (page - 1) * per_page
+    stmt = stmt.order_by(*params.order_by())
 
-    total_pages = (total_items + per_page - 1) // per_page
+    if settings.MOVIES_TOTAL_MODE == "estimate" and not params.has_filters:
+        # The planner estimate is only displayed: it may be short of the real row count,
+        # so the page query always runs and one extra row tells whether a next page exists.
+        total_items = await _get_total_items(db, params)
+        result = await db.execute(stmt.offset(offset).limit(per_page + 1))
+        movies = list(result.scalars().all())
+        has_next = len(movies) > per_page
+        movies = movies[:per_page]
+        total_items = max(total_items, offset + len(movies) + has_next)
+    else:
+        if settings.MOVIES_TOTAL_MODE == "window":
+            total_column = func.count().over()
+        elif params.has_filters:
+            total_column = params.count_statement().scalar_subquery()
+        else:
+            total_column = movies_total_subquery()
+        movies, total_items = await _fetch_page_with_total(
+            db, stmt, total_column, offset, per_page
+        )
+        if movies and total_items is None:
+            total_items = await get_movies_total(db)
+        has_next = offset + per_page < total_items
 
-    if page > total_pages and total_items > 0:
+    if not movies:
         raise HTTPException(status_code=404, detail="No movies found.")
-
     total_pages = (total_items + per_page - 1) // per_page
+    movie_list = _list_items(movies, field_names)
+
     response = MovieListResponseSchema(movies=movie_list,
                                        prev_page=(
-                                           f"/theater/movies/?page={page - 1}&per_page={per_page}"
+                                           _movies_link(params, page=page - 1, per_page=per_page, fields=fields)
                                            if page > 1
                                            else None
                                        ),
                                        next_page=(
-                                           f"/theater/movies/?page={page + 1}&per_page={per_page}"
-                                           if page < total_pages
+                                           _movies_link(params, page=page + 1, per_page=per_page, fields=fields)
+                                           if has_next
+                                           else None
+                                       ),
+                                       prev_cursor=(
+                                           params.cursor(movies[0], "prev")
+                                           if page > 1
+                                           else None
+                                       ),
+                                       next_cursor=(
+                                           params.cursor(movies[-1], "next")
+                                           if has_next
                                            else None
                                        ),
                                        total_pages=total_pages,
                                        total_items=total_items)
-    return response
+    return _render_sparse(response, field_names, etag)
+
+
+def _movies_link(params: MovieListParams, **pagination) -> str:
+    pagination = {key: value for key, value in pagination.items() if value is not None}
+    query = urlencode({**pagination, **params.query_params()})
+    return f"/theater/movies/?{query}"
+
+
+def _join(field_names: Optional[List[str]]) -> Optional[str]:
+    return ",".join(field_names) if field_names else None
+
+
+def _parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Parse a `fields=` parameter into the list of requested schema fields.
+
+    :return: The field names in request order, or None if all fields are requested.
+    :raises HTTPException: 422 if a field does not exist on the schema.
+    """
+    if fields is None:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in schema.model_fields]
+    if not names or unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields: {', '.join(unknown)}. "
+                   f"Allowed fields: {', '.join(schema.model_fields)}.",
+        )
+    return names
+
+
+def _list_items(movies: List[MovieModel], field_names: Optional[List[str]]) -> list:
+    if field_names is None:
+        return [MovieListItemSchema.model_validate(movie) for movie in movies]
+    return [
+        MovieListItemSchema.model_construct(
+            **{name: getattr(movie, name) for name in field_names}
+        )
+        for movie in movies
+    ]
+
+
+def _render_sparse(response_data: BaseModel, field_names: Optional[List[str]], etag: str):
+    """
+    Return `response_data` as is, or as JSON without the fields that were not requested.
+
+    Sparse items are built with `model_construct`, so they bypass response_model validation.
+    """
+    if field_names is None:
+        return response_data
+    return JSONResponse(
+        content=response_data.model_dump(mode="json", exclude_unset=True),
+        headers=cache_headers(etag),
+    )
+
+
+async def _get_total_items(db: AsyncSession, params: MovieListParams) -> int:
+    if params.has_filters:
+        return await db.scalar(params.count_statement())
+    return await get_movies_total(
+        db, approximate=settings.MOVIES_TOTAL_MODE == "estimate"
+    )
+
+
+async def _fetch_page_with_total(
+    db: AsyncSession, stmt, total_column, offset: int, limit: int
+) -> Tuple[List[MovieModel], Optional[int]]:
+    """
+    Fetch one page of movies and the total row count in a single round trip.
+
+    `total_column` is added to every row: either the maintained counter as an
+    uncorrelated scalar subquery (evaluated once) or an exact `COUNT(*) OVER ()` window.
+    An empty page (empty table or a page past the end) yields a total of 0.
+    """
+    result = await db.execute(
+        stmt.add_columns(total_column.label("total_items")).offset(offset).limit(limit)
+    )
+    rows = result.all()
+    if not rows:
+        return [], 0
+    return [row[0] for row in rows], rows[0].total_items
+
+
+async def _list_movies_by_cursor(
+    db: AsyncSession,
+    stmt,
+    params: MovieListParams,
+    cursor: str,
+    per_page: int,
+    total_items: Optional[int],
+    total_pages: Optional[int],
+    field_names: Optional[List[str]] = None,
+) -> MovieListResponseSchema:
+    """
+    Seek to the page after (or before) the cursor position instead of using OFFSET.
+
+    The query fetches one extra row to find out whether another page exists in the
+    direction of travel, so its cost does not depend on how deep the page is.
+    """
+    position = decode_cursor(cursor)
+    forward = position["dir"] == "next"
+
+    stmt = (
+        stmt.where(params.seek(position))
+        .order_by(*params.order_by(reverse=not forward))
+        .limit(per_page + 1)
+    )
+
+    result = await db.execute(stmt)
+    movies = list(result.scalars().all())
+    has_more = len(movies) > per_page
+    movies = movies[:per_page]
+    if not forward:
+        movies.reverse()
+
+    if not movies:
+        raise HTTPException(status_code=404, detail="No movies found.")
+
+    prev_cursor = params.cursor(movies[0], "prev") if forward or has_more else None
+    next_cursor = params.cursor(movies[-1], "next") if has_more or not forward else None
+    return MovieListResponseSchema(
+        movies=_list_items(movies, field_names),
+        prev_page=(
+            _movies_link(params, per_page=per_page, cursor=prev_cursor, fields=_join(field_names))
+            if prev_cursor
+            else None
+        ),
+        next_page=(
+            _movies_link(params, per_page=per_page, cursor=next_cursor, fields=_join(field_names))
+            if next_cursor
+            else None
+        ),
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
+        total_pages=total_pages,
+        total_items=total_items,
+    )
+
+
+@router.get("/movies/search/", response_model=MovieSearchResponseSchema)
+async def search_movies(
+    q: str = Query(..., min_length=1, max_length=200),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_db),
+):
+    stmt = search_movies_statement(db, q)
+    movies = []
+    if stmt is not None:
+        result = await db.execute(stmt.offset((page - 1) * per_page).limit(per_page + 1))
+        movies = list(result.scalars().all())
+
+    has_more = len(movies) > per_page
+    return MovieSearchResponseSchema(
+        movies=[MovieListItemSchema.model_validate(movie) for movie in movies[:per_page]],
+        prev_page=(
+            "/theater/movies/search/?"
+            + urlencode({"q": q, "page": page - 1, "per_page": per_page})
+            if page > 1
+            else None
+        ),
+        next_page=(
+            "/theater/movies/search/?"
+            + urlencode({"q": q, "page": page + 1, "per_page": per_page})
+            if has_more
+            else None
+        ),
+    )
+
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = ["id", "name", "date", "score", "overview", "status", "budget", "revenue", "country"]
+EXPORT_RELATIONS = {
+    "genres": (MoviesGenresModel, GenreModel, MoviesGenresModel.c.genre_id),
+    "actors": (ActorsMoviesModel, ActorModel, ActorsMoviesModel.c.actor_id),
+    "languages": (MoviesLanguagesModel, LanguageModel, MoviesLanguagesModel.c.language_id),
+}
+
+
+@router.get(
+    "/movies/export/",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+async def export_movies(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    include: Optional[str] = Query(
+        None, description="Comma-separated relations to add: genres, actors, languages."
+    ),
+):
+    relations = []
+    if include:
+        relations = list(dict.fromkeys(name.strip() for name in include.split(",") if name.strip()))
+        unknown = [name for name in relations if name not in EXPORT_RELATIONS]
+        if unknown:
+            raise HTTPException(
+                status_code=422, detail=f"Unknown relations: {', '.join(unknown)}."
+            )
+
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+    return StreamingResponse(
+        _stream_export(format, relations),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="movies.{format}"'},
+    )
+
+
+async def _stream_export(format: str, relations: List[str]) -> AsyncIterator[bytes]:
+    """
+    Stream the whole catalogue from a server-side cursor, one encoded batch at a time.
+
+    The generator opens its own session because the request-scoped one is closed before
+    the response body is sent. Relations are aggregated per movie with correlated JSON
+    subqueries, so the export is a single streamed statement and memory stays bounded by
+    EXPORT_BATCH_SIZE.
+    """
+    async with get_db_contextmanager() as db:
+        stmt = (
+            select(
+                MovieModel.id,
+                MovieModel.name,
+                MovieModel.date,
+                MovieModel.score,
+                MovieModel.overview,
+                MovieModel.status,
+                MovieModel.budget,
+                MovieModel.revenue,
+                CountryModel.code.label("country"),
+            )
+            .join(CountryModel, CountryModel.id == MovieModel.country_id)
+            .order_by(MovieModel.id)
+        )
+        for relation in relations:
+            stmt = stmt.add_columns(_aggregate_names(db, relation).label(relation))
+
+        header = EXPORT_COLUMNS + relations
+        if format == "csv":
+            yield _encode_csv_rows([header])
+
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            records = []
+            for row in rows:
+                record = dict(zip(EXPORT_COLUMNS, row[: len(EXPORT_COLUMNS)]))
+                record["date"] = record["date"].isoformat()
+                record["status"] = record["status"].value
+                record["budget"] = float(record["budget"])
+                for relation, names in zip(relations, row[len(EXPORT_COLUMNS):]):
+                    record[relation] = names or []
+                records.append(record)
+
+            if format == "ndjson":
+                yield "".join(json.dumps(record) + "\n" for record in records).encode()
+            else:
+                yield _encode_csv_rows(
+                    [
+                        [
+                            ",".join(value) if isinstance(value, list) else value
+                            for value in record.values()
+                        ]
+                        for record in records
+                    ]
+                )
+
+
+def _aggregate_names(db: AsyncSession, relation: str):
+    association, model, entity_id = EXPORT_RELATIONS[relation]
+    if dialect_name(db) == "postgresql":
+        aggregate = func.json_agg(model.name, type_=JSON)
+    else:
+        aggregate = func.json_group_array(model.name, type_=JSON)
+    return (
+        select(aggregate)
+        .select_from(association.join(model, model.id == entity_id))
+        .where(association.c.movie_id == MovieModel.id)
+        .correlate(MovieModel)
+        .scalar_subquery()
+    )
+
+
+def _encode_csv_rows(rows: list) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+MAX_BATCH_IDS = 50
+
+
+@router.get("/movies/batch/", response_model=MovieBatchResponseSchema)
+async def get_movies_batch(
+    ids: str = Query(..., description="Comma-separated movie ids, e.g. `ids=3,1,2`."),
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        movie_ids = list(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="ids must be a comma-separated list of integers.")
+    if not movie_ids:
+        raise HTTPException(status_code=422, detail="At least one id is required.")
+    if len(movie_ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=422, detail=f"At most {MAX_BATCH_IDS} ids can be requested at once."
+        )
+
+    result = await db.execute(
+        select(MovieModel)
+        .options(*movie_detail_loader_options())
+        .where(MovieModel.id.in_(movie_ids))
+    )
+    movies_by_id = {movie.id: movie for movie in result.scalars().all()}
+
+    return MovieBatchResponseSchema(
+        movies=[
+            MovieDetailSchema.model_validate(movies_by_id[movie_id])
+            for movie_id in movie_ids
+            if movie_id in movies_by_id
+        ],
+        missing_ids=[movie_id for movie_id in movie_ids if movie_id not in movies_by_id],
+    )
+
 
 @router.get("/movies/{movie_id}/", response_model=MovieDetailSchema, status_code=200)
-async def get_movie_by_id(movie_id: int, db: AsyncSession = Depends(get_db)):
+async def get_movie_by_id(
+    movie_id: int,
+    db: AsyncSession = Depends(get_db),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated subset of movie fields, e.g. `id,name,genres`."
+    ),
+    if_none_match: Optional[str] = Header(None),
+):
+    field_names = _parse_fields(fields, MovieDetailSchema)
+    use_cache = settings.MOVIE_DETAIL_CACHE_ENABLED and field_names is None
+    if use_cache:
+        cached = movie_detail_cache.get(movie_id)
+        if cached is not None:
+            etag, body = cached
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+            return Response(
+                content=body, media_type="application/json", headers=cache_headers(etag)
+            )
+        generation = movie_detail_cache.generation()
+
+    version = await db.scalar(select(MovieModel.version).where(MovieModel.id == movie_id))
+    if version is None:
+        raise HTTPException(
+            status_code=404, detail="Movie with the given ID was not found."
+        )
+    etag = make_etag("movie", movie_id, version, field_names)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    options = (
+        movie_detail_loader_options()
+        if field_names is None
+        else _sparse_detail_loader_options(field_names)
+    )
     stmt = (
         select(MovieModel)
-        .options(
-            joinedload(MovieModel.country),
-            joinedload(MovieModel.genres),
-            joinedload(MovieModel.actors),
-            joinedload(MovieModel.languages),
-        ).where(MovieModel.id == movie_id)
+        .options(*options)
+        .where(MovieModel.id == movie_id)
     )
 
     result = await db.execute(stmt)
@@ -97,8 +543,54 @@ async def get_movie_by_id(movie_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(
             status_code=404, detail="Movie with the given ID was not found."
         )
-    return MovieDetailSchema.model_validate(movie)
+    etag = make_etag("movie", movie_id, movie.version, field_names)
+    if field_names is None:
+        body = MovieDetailSchema.model_validate(movie).model_dump_json().encode()
+    else:
+        body = _dump_fields(MovieDetailSchema, movie, field_names)
+    if use_cache:
+        movie_detail_cache.set(movie_id, etag, body, generation=generation)
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag))
+
 
+def _sparse_detail_loader_options(field_names: List[str]) -> list:
+    """
+    Load only the requested columns of a movie and only the requested relationships.
+    """
+    columns = [
+        getattr(MovieModel, name) for name in field_names if name not in MOVIE_RELATIONSHIPS
+    ]
+    options = [load_only(MovieModel.version, *columns)]
+    for name in field_names:
+        if name == "country":
+            options.append(joinedload(MovieModel.country))
+        elif name in MOVIE_RELATIONSHIPS:
+            options.append(selectinload(getattr(MovieModel, name)))
+    return options
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(schema: Type[BaseModel], name: str) -> TypeAdapter:
+    return TypeAdapter(schema.model_fields[name].annotation)
+
+
+def _dump_fields(schema: Type[BaseModel], obj: object, field_names: List[str]) -> bytes:
+    """
+    Serialize only `field_names` of `obj`, each validated against its type on `schema`.
+    """
+    data = {}
+    for name in field_names:
+        adapter = _field_adapter(schema, name)
+        value = adapter.validate_python(getattr(obj, name), from_attributes=True)
+        data[name] = adapter.dump_python(value, mode="json")
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+@router.get("/movies/cache/stats/", response_model=CacheStatsSchema)
+async def get_movie_cache_stats():
+    return CacheStatsSchema(
+        enabled=settings.MOVIE_DETAIL_CACHE_ENABLED, **movie_detail_cache.stats()
+    )
 
 
 @router.post("/movies/", response_model=MovieDetailSchema, status_code=201)
@@ -107,6 +599,18 @@ async def add_movie(movie: MovieCreateSchema, db: AsyncSession = Depends(get_db)
     return new_movie
 
 
+@router.post("/movies/bulk/", response_model=MovieBulkCreateResponseSchema)
+async def add_movies_bulk(payload: MovieBulkCreateSchema, db: AsyncSession = Depends(get_db)):
+    return await bulk_create_movies(db, payload.movies)
+
+
+@router.post("/movies/bulk-delete/", response_model=MovieBulkDeleteResponseSchema)
+async def delete_movies_bulk(
+    payload: MovieBulkDeleteSchema, db: AsyncSession = Depends(get_db)
+):
+    return await bulk_delete_movies(db, payload)
+
+
 @router.patch("/movies/{movie_id}/")
 async def edit_movie(
     movie_id: int, movie: MovieUpdateSchema, db: AsyncSession = Depends(get_db)
@@ -118,9 +622,5 @@ async def edit_movie(
 
 @router.delete("/movies/{movie_id}/", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_movie(movie_id: int, db: AsyncSession = Depends(get_db)):
-    deleted_movie = await delete_movie_crud(db, movie_id)
-    if not deleted_movie:
-        raise HTTPException(
-            status_code=404, detail="Movie with the given ID was not found."
-        )
+    await delete_movie_crud(db, movie_id)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,36 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db
+from database.models import MovieStatusEnum
+from database.stats import get_movie_stats
+from schemas.movies import MovieStatSchema, MovieStatsResponseSchema
+
+router = APIRouter()
+
+
+@router.get("/stats/{dimension}/", response_model=MovieStatsResponseSchema)
+async def get_stats(
+    dimension: Literal["genre", "year", "country", "status"],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Return the movie count, average score and total budget and revenue per genre, release
+    year, country code or status, read from the precomputed `movie_stats` rollups.
+    """
+    rows = await get_movie_stats(db, dimension)
+    return MovieStatsResponseSchema(
+        dimension=dimension,
+        items=[
+            MovieStatSchema(
+                key=MovieStatusEnum[row.key].value if dimension == "status" else row.key,
+                movie_count=row.movie_count,
+                average_score=round(row.score_sum / row.movie_count, 2),
+                total_budget=row.budget_sum,
+                total_revenue=row.revenue_sum,
+            )
+            for row in rows
+        ],
+    )
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, constr, confloat, conint, Field, field_validator
+from pydantic import BaseModel, constr, confloat, conint, Field, field_validator, model_validator
 from datetime import date, datetime
+from datetime import date as Date
 from typing import Optional, List, Literal
 
 from database.models import MovieStatusEnum
@@ -43,17 +44,17 @@ class MovieListItemSchema(BaseModel):
 
 
 class MovieCreateSchema(BaseModel):
-    name: str
+    name: str = Field(..., max_length=255)
     date: date
     score: float = Field(..., ge=0, le=100)
     overview: str
     status: MovieStatusEnum
     budget: float = Field(..., ge=0)
     revenue: float = Field(..., ge=0)
-    country: str
-    genres: List[str]
-    actors: List[str]
-    languages: List[str]
+    country: constr(max_length=3)
+    genres: List[constr(max_length=255)]
+    actors: List[constr(max_length=255)]
+    languages: List[constr(max_length=255)]
 
     model_config = {"from_attributes": True}
 
@@ -93,16 +94,17 @@ class MovieDetailSchema(MovieBaseSchema):
 
 class MovieUpdateSchema(BaseModel):
     name: Optional[constr(min_length=1, max_length=100)] = None
-    date: Optional[date] = None
+    # Annotated through an alias: `Optional[date]` would resolve to this field's own default.
+    date: Optional[Date] = None
     score: Optional[confloat(ge=0, le=100)] = None
     overview: Optional[str] = None
     status: Optional[MovieStatusEnum] = None
     budget: Optional[confloat(ge=0)] = None
     revenue: Optional[confloat(ge=0)] = None
-    country: Optional[str] = None
-    genres: Optional[List[str]] = None
-    actors: Optional[List[str]] = None
-    languages: Optional[List[str]] = None
+    country: Optional[constr(max_length=3)] = None
+    genres: Optional[List[constr(max_length=255)]] = None
+    actors: Optional[List[constr(max_length=255)]] = None
+    languages: Optional[List[constr(max_length=255)]] = None
 
     model_config = {"from_attributes": True}
 
@@ -111,9 +113,96 @@ class MovieListResponseSchema(BaseModel):
     movies: List[MovieListItemSchema]
     prev_page: Optional[str] = None
     next_page: Optional[str] = None
-    total_pages: int
-    total_items: int
+    prev_cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
+    total_pages: Optional[int] = None
+    total_items: Optional[int] = None
+
+    model_config = {
+        "from_attributes": True,
+    }
+
+
+class MovieSearchResponseSchema(BaseModel):
+    movies: List[MovieListItemSchema]
+    prev_page: Optional[str] = None
+    next_page: Optional[str] = None
 
     model_config = {
         "from_attributes": True,
     }
+
+
+class CacheStatsSchema(BaseModel):
+    enabled: bool
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class MovieBatchResponseSchema(BaseModel):
+    movies: List[MovieDetailSchema]
+    missing_ids: List[int]
+
+
+class MovieBulkCreateSchema(BaseModel):
+    movies: List[MovieCreateSchema] = Field(..., min_length=1, max_length=5000)
+
+
+class MovieBulkItemResultSchema(BaseModel):
+    index: int
+    status: Literal["created", "conflict"]
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class MovieBulkCreateResponseSchema(BaseModel):
+    created: int
+    conflicts: int
+    results: List[MovieBulkItemResultSchema]
+
+
+class MovieBulkDeleteSchema(BaseModel):
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000)
+    status: Optional[MovieStatusEnum] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+
+    @model_validator(mode="after")
+    def validate_selection(self):
+        has_filter = any(
+            value is not None for value in (self.status, self.date_from, self.date_to)
+        )
+        if self.ids is None and not has_filter:
+            raise ValueError("Provide movie ids or at least one of status, date_from, date_to.")
+        if self.ids is not None and has_filter:
+            raise ValueError("Provide either movie ids or a filter, not both.")
+        return self
+
+
+class MovieBulkDeleteResponseSchema(BaseModel):
+    deleted: int
+
+
+class EntityMoviesResponseSchema(BaseModel):
+    movies: List[MovieListItemSchema]
+    prev_page: Optional[str] = None
+    next_page: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
+
+
+class MovieStatSchema(BaseModel):
+    key: str
+    movie_count: int
+    average_score: float
+    total_budget: float
+    total_revenue: float
+
+
+class MovieStatsResponseSchema(BaseModel):
+    dimension: str
+    items: List[MovieStatSchema]
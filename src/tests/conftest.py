@@ -1,8 +1,10 @@
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
+from caching import movie_detail_cache
 from config import get_settings
 from database import reset_database, get_db_contextmanager
+from database.reference_cache import reference_cache
 from database.populate import CSVDatabaseSeeder
 from main import app
 
@@ -14,8 +16,11 @@ async def reset_db():
 
     This fixture ensures that the database is cleared and recreated for every test function.
     It helps maintain test isolation by preventing data leakage between tests.
+    The in-process movie detail and reference caches are cleared as well.
     """
     await reset_database()
+    movie_detail_cache.clear()
+    reference_cache.clear()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -1,11 +1,26 @@
+import csv
+import datetime
+import io
+import json
 import random
 
+import pandas as pd
 import pytest
-from sqlalchemy import select, func
+from sqlalchemy import event, select, func
 from sqlalchemy.orm import joinedload
 
-from database import MovieModel
-from database.models import GenreModel, ActorModel, LanguageModel, CountryModel
+from config import get_settings
+from database import MovieModel, reset_database
+from database.populate import CSVDatabaseSeeder
+from database.reference_cache import reference_cache
+from database.models import (
+    GenreModel,
+    ActorModel,
+    LanguageModel,
+    CountryModel,
+    CounterModel,
+    MoviesGenresModel,
+)
 
 
 @pytest.mark.asyncio
@@ -622,3 +637,1126 @@ async def test_update_movie_not_found(client):
     assert (
         response_data["detail"] == expected_detail
     ), f"Expected detail message: {expected_detail}, but got: {response_data['detail']}"
+
+
+@pytest.mark.asyncio
+async def test_movie_list_cursor_matches_offset_pages(client, seed_database):
+    """
+    Test that following `next_cursor` returns the same movies as the next offset page,
+    and that `prev_cursor` leads back to the first page.
+    """
+    per_page = 5
+
+    first_page = await client.get(f"/api/v1/theater/movies/?page=1&per_page={per_page}")
+    assert first_page.status_code == 200, f"Expected 200, got {first_page.status_code}"
+    first_data = first_page.json()
+    assert first_data["prev_cursor"] is None, "First page should not have prev_cursor."
+    assert first_data["next_cursor"] is not None, "First page should have next_cursor."
+
+    offset_page = await client.get(f"/api/v1/theater/movies/?page=2&per_page={per_page}")
+    cursor_page = await client.get(
+        f"/api/v1/theater/movies/?per_page={per_page}&cursor={first_data['next_cursor']}"
+    )
+    assert cursor_page.status_code == 200, f"Expected 200, got {cursor_page.status_code}"
+    cursor_data = cursor_page.json()
+
+    assert [movie["id"] for movie in cursor_data["movies"]] == [
+        movie["id"] for movie in offset_page.json()["movies"]
+    ], "Cursor page does not match the offset page."
+    assert cursor_data["total_items"] == first_data["total_items"], "Total items mismatch."
+    assert cursor_data["next_page"] == (
+        f"/theater/movies/?per_page={per_page}&cursor={cursor_data['next_cursor']}"
+    ), "Next page link should carry the cursor."
+
+    back_page = await client.get(
+        f"/api/v1/theater/movies/?per_page={per_page}&cursor={cursor_data['prev_cursor']}"
+    )
+    assert back_page.status_code == 200, f"Expected 200, got {back_page.status_code}"
+    assert [movie["id"] for movie in back_page.json()["movies"]] == [
+        movie["id"] for movie in first_data["movies"]
+    ], "prev_cursor did not lead back to the first page."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_invalid_cursor(client, seed_database):
+    """
+    Test that a malformed cursor is rejected with a 400 error.
+    """
+    response = await client.get("/api/v1/theater/movies/?cursor=not-a-cursor")
+    assert (
+        response.status_code == 400
+    ), f"Expected status code 400, but got {response.status_code}"
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+@pytest.mark.asyncio
+async def test_movies_total_counter_follows_create_and_delete(
+    client, db_session, seed_database
+):
+    """
+    Test that `total_items` is served from the maintained counter and stays in sync with
+    the movies table when movies are created and deleted.
+    """
+    count_stmt = select(func.count(MovieModel.id))
+    total_movies = (await db_session.execute(count_stmt)).scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/")
+    assert response.json()["total_items"] == total_movies, "Total items mismatch."
+
+    movie_data = {
+        "name": "Counter Movie",
+        "date": "2024-05-01",
+        "score": 70.0,
+        "overview": "Counted once.",
+        "status": "Released",
+        "budget": 1000.0,
+        "revenue": 2000.0,
+        "country": "US",
+        "genres": ["Drama"],
+        "actors": ["Counter Actor"],
+        "languages": ["English"],
+    }
+    create_response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert create_response.status_code == 201, "Movie was not created."
+
+    response = await client.get("/api/v1/theater/movies/")
+    assert (
+        response.json()["total_items"] == total_movies + 1
+    ), "Counter was not incremented on create."
+
+    delete_response = await client.delete(
+        f"/api/v1/theater/movies/{create_response.json()['id']}/"
+    )
+    assert delete_response.status_code == 204, "Movie was not deleted."
+
+    response = await client.get("/api/v1/theater/movies/")
+    assert (
+        response.json()["total_items"] == total_movies
+    ), "Counter was not decremented on delete."
+
+    counter = await db_session.scalar(
+        select(CounterModel.value).where(CounterModel.name == "movies_total")
+    )
+    assert counter == total_movies, "Counter row does not match the movies table."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("total_mode", ["counter", "window", "estimate"])
+async def test_movie_list_total_modes(
+    client, db_session, seed_database, monkeypatch, total_mode
+):
+    """
+    Test that every `MOVIES_TOTAL_MODE` returns the same page and the exact total
+    on the SQLite backend.
+    """
+    from routes import movies as movies_routes
+
+    monkeypatch.setattr(movies_routes.settings, "MOVIES_TOTAL_MODE", total_mode)
+
+    total_items = (
+        await db_session.execute(select(func.count(MovieModel.id)))
+    ).scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/?page=2&per_page=5")
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+    assert response_data["total_items"] == total_items, "Total items mismatch."
+    assert len(response_data["movies"]) == 5, "Expected 5 movies on the page."
+
+    past_end = (total_items + 4) // 5 + 1
+    response = await client.get(f"/api/v1/theater/movies/?page={past_end}&per_page=5")
+    assert (
+        response.status_code == 404
+    ), f"Expected status code 404, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_movie_list_estimate_does_not_bound_pages(
+    client, db_session, seed_database, monkeypatch
+):
+    """
+    Test that in the "estimate" mode an underestimated total neither hides the real
+    pages past it nor drops their next links.
+    """
+    from routes import movies as movies_routes
+
+    async def underestimate(db, approximate=False):
+        return 3
+
+    monkeypatch.setattr(movies_routes.settings, "MOVIES_TOTAL_MODE", "estimate")
+    monkeypatch.setattr(movies_routes, "get_movies_total", underestimate)
+
+    response = await client.get("/api/v1/theater/movies/?page=2&per_page=5")
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+    assert len(response_data["movies"]) == 5, "Expected 5 movies on the page."
+    assert response_data["next_page"] is not None, "The next page link is missing."
+    assert response_data["total_items"] >= 11, "The total should cover the pages seen."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_filter_by_genre_and_score(client, db_session, seed_database):
+    """
+    Test that the genre and score filters only return matching movies, that
+    `total_items` counts the filtered movies on the first page and that cursor pages
+    skip the count.
+    """
+    genre = (await db_session.execute(select(GenreModel).limit(1))).scalars().first()
+    assert genre is not None, "No genres found in the database."
+
+    stmt = (
+        select(MovieModel.id)
+        .where(MovieModel.genres.any(GenreModel.id == genre.id), MovieModel.score >= 50)
+        .order_by(MovieModel.id.desc())
+    )
+    expected_ids = list((await db_session.execute(stmt)).scalars().all())
+
+    response = await client.get(
+        "/api/v1/theater/movies/",
+        params={"genre": genre.name, "score_min": 50, "per_page": 20},
+    )
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+
+    assert response_data["total_items"] == len(expected_ids), "Filtered total mismatch."
+    assert [movie["id"] for movie in response_data["movies"]] == expected_ids[:20], (
+        "Filtered movies mismatch."
+    )
+
+    params = {"genre": genre.name, "score_min": 50, "per_page": 2}
+    first_page = (await client.get("/api/v1/theater/movies/", params=params)).json()
+    assert len(expected_ids) > 2, "Expected more than one page of filtered movies."
+    response = await client.get(
+        "/api/v1/theater/movies/", params={**params, "cursor": first_page["next_cursor"]}
+    )
+    response_data = response.json()
+    assert [movie["id"] for movie in response_data["movies"]] == expected_ids[2:4]
+    assert response_data["total_items"] is None, "Cursor pages should not recount the matches."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_sorted_by_score_with_cursor(client, db_session, seed_database):
+    """
+    Test sorting by score ascending, and that cursor paging keeps the sort order and
+    carries the sort parameters in the page links.
+    """
+    stmt = select(MovieModel.id).order_by(MovieModel.score.asc(), MovieModel.id.asc())
+    expected_ids = list((await db_session.execute(stmt)).scalars().all())
+
+    response = await client.get(
+        "/api/v1/theater/movies/?per_page=5&sort=score&order=asc"
+    )
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    first_page = response.json()
+    assert [movie["id"] for movie in first_page["movies"]] == expected_ids[:5]
+    assert first_page["next_page"] == "/theater/movies/?page=2&per_page=5&sort=score&order=asc"
+
+    response = await client.get(
+        "/api/v1/theater/movies/",
+        params={
+            "per_page": 5,
+            "sort": "score",
+            "order": "asc",
+            "cursor": first_page["next_cursor"],
+        },
+    )
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    assert [movie["id"] for movie in response.json()["movies"]] == expected_ids[5:10]
+
+    response = await client.get(
+        "/api/v1/theater/movies/",
+        params={"per_page": 5, "cursor": first_page["next_cursor"]},
+    )
+    assert (
+        response.status_code == 400
+    ), "A cursor issued for another sort order should be rejected."
+
+
+@pytest.mark.asyncio
+async def test_search_movies_ranks_name_matches(client, seed_database):
+    """
+    Test that `/movies/search/` finds a seeded movie by a word of its name and ranks it first.
+    """
+    response = await client.get("/api/v1/theater/movies/search/", params={"q": "creed"})
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+
+    movies = response.json()["movies"]
+    assert movies, "Expected at least one search result."
+    assert movies[0]["name"] == "Creed III", f"Unexpected best match: {movies[0]['name']}"
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_create_update_and_delete(client):
+    """
+    Test that the search index is updated when a movie is created, renamed and deleted.
+    """
+    movie_data = {
+        "name": "Zanzibar Nights",
+        "date": "2024-02-02",
+        "score": 60.0,
+        "overview": "A heist on a spice island.",
+        "status": "Released",
+        "budget": 1000.0,
+        "revenue": 1000.0,
+        "country": "US",
+        "genres": ["Drama"],
+        "actors": ["Search Actor"],
+        "languages": ["English"],
+    }
+    create_response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert create_response.status_code == 201, "Movie was not created."
+    movie_id = create_response.json()["id"]
+
+    response = await client.get("/api/v1/theater/movies/search/", params={"q": "spice"})
+    assert [movie["id"] for movie in response.json()["movies"]] == [movie_id]
+
+    await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"name": "Kilimanjaro"})
+    response = await client.get("/api/v1/theater/movies/search/", params={"q": "zanzibar"})
+    assert response.json()["movies"] == [], "Old name should no longer match."
+    response = await client.get("/api/v1/theater/movies/search/", params={"q": "kiliman"})
+    assert [movie["id"] for movie in response.json()["movies"]] == [movie_id]
+
+    await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+    response = await client.get("/api/v1/theater/movies/search/", params={"q": "spice"})
+    assert response.json()["movies"] == [], "Deleted movie should not be found."
+
+
+@pytest.mark.asyncio
+async def test_get_movie_by_id_etag_not_modified(client, db_session, seed_database):
+    """
+    Test that the detail endpoint answers a matching If-None-Match with an empty 304,
+    and that an update changes the ETag.
+    """
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalars().first()
+    url = f"/api/v1/theater/movies/{movie.id}/"
+
+    response = await client.get(url)
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    etag = response.headers.get("etag")
+    assert etag, "Expected an ETag header."
+    assert response.headers.get("cache-control"), "Expected a Cache-Control header."
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304, f"Expected 304, got {response.status_code}"
+    assert response.content == b"", "A 304 response must not have a body."
+    assert response.headers.get("etag") == etag, "304 should repeat the ETag."
+
+    await client.patch(url, json={"score": 12.5})
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200, "Stale ETag should return the full movie."
+    assert response.headers.get("etag") != etag, "ETag should change after an update."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_etag_changes_after_write(client, db_session, seed_database):
+    """
+    Test that the list endpoint returns 304 for a current ETag and a new representation
+    after a movie is deleted.
+    """
+    url = "/api/v1/theater/movies/?page=1&per_page=5"
+    response = await client.get(url)
+    etag = response.headers.get("etag")
+    assert etag, "Expected an ETag header."
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304, f"Expected 304, got {response.status_code}"
+
+    other_page = await client.get(
+        "/api/v1/theater/movies/?page=2&per_page=5", headers={"If-None-Match": etag}
+    )
+    assert other_page.status_code == 200, "ETag must depend on the query parameters."
+
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalars().first()
+    await client.delete(f"/api/v1/theater/movies/{movie.id}/")
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200, "Stale ETag should return the full list."
+    assert response.headers.get("etag") != etag, "ETag should change after a delete."
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_etag_not_reused_after_delete(client):
+    """
+    Test that a movie created after a delete gets a new id, so the ETag of the deleted
+    movie never matches it.
+    """
+    movie_data = {
+        "name": "Deleted Movie",
+        "date": "2025-01-01",
+        "score": 70.0,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000000.00,
+        "revenue": 2000000.00,
+        "country": "US",
+        "genres": ["Action"],
+        "actors": ["John Doe"],
+        "languages": ["English"],
+    }
+    movie_id = (await client.post("/api/v1/theater/movies/", json=movie_data)).json()["id"]
+    etag = (await client.get(f"/api/v1/theater/movies/{movie_id}/")).headers["etag"]
+    await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+
+    response = await client.post(
+        "/api/v1/theater/movies/", json={**movie_data, "name": "Replacement Movie"}
+    )
+    new_id = response.json()["id"]
+    assert new_id != movie_id, "The id of a deleted movie was reused."
+
+    response = await client.get(f"/api/v1/theater/movies/{new_id}/", headers={"If-None-Match": etag})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_cache_hits_and_invalidation(client, db_session, seed_database):
+    """
+    Test that repeated detail requests are served from the byte cache and that an update
+    invalidates the cached entry.
+    """
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalars().first()
+    url = f"/api/v1/theater/movies/{movie.id}/"
+
+    first = await client.get(url)
+    second = await client.get(url)
+    assert first.status_code == second.status_code == 200, "Expected 200 responses."
+    assert first.json() == second.json(), "Cached body differs from the original."
+
+    stats = (await client.get("/api/v1/theater/movies/cache/stats/")).json()
+    assert stats["misses"] == 1, f"Expected 1 miss, got {stats['misses']}"
+    assert stats["hits"] == 1, f"Expected 1 hit, got {stats['hits']}"
+    assert stats["entries"] == 1, f"Expected 1 cached entry, got {stats['entries']}"
+
+    await client.patch(url, json={"name": "Cache Busted"})
+
+    response = await client.get(url)
+    assert response.json()["name"] == "Cache Busted", "Stale cached movie was returned."
+    stats = (await client.get("/api/v1/theater/movies/cache/stats/")).json()
+    assert stats["misses"] == 2, "Update should have invalidated the cached entry."
+
+
+@pytest.mark.asyncio
+async def test_movie_detail_cache_skips_body_invalidated_during_load(
+    client, db_session, seed_database, monkeypatch
+):
+    """
+    Test that a body loaded while the movie was being invalidated is not put into the cache.
+    """
+    from caching import invalidate_movie_detail, movie_detail_cache
+    from routes import movies as movies_routes
+
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalars().first()
+    url = f"/api/v1/theater/movies/{movie.id}/"
+    loader_options = movies_routes.movie_detail_loader_options
+
+    def invalidating_loader_options():
+        invalidate_movie_detail(movie.id)
+        return loader_options()
+
+    monkeypatch.setattr(movies_routes, "movie_detail_loader_options", invalidating_loader_options)
+    response = await client.get(url)
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+    assert movie_detail_cache.get(movie.id) is None, "Possibly stale body was cached."
+
+    monkeypatch.setattr(movies_routes, "movie_detail_loader_options", loader_options)
+    await client.get(url)
+    assert movie_detail_cache.get(movie.id) is not None, "Fresh body was not cached."
+
+
+@pytest.mark.asyncio
+async def test_get_movies_batch_in_request_order(client, db_session, seed_database):
+    """
+    Test that `/movies/batch/` returns the requested movies in request order and reports
+    ids that do not exist.
+    """
+    stmt = select(MovieModel.id).order_by(MovieModel.id.asc()).limit(3)
+    movie_ids = list((await db_session.execute(stmt)).scalars().all())
+    requested = [movie_ids[2], 99999, movie_ids[0], movie_ids[1]]
+
+    response = await client.get(
+        "/api/v1/theater/movies/batch/",
+        params={"ids": ",".join(str(movie_id) for movie_id in requested)},
+    )
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+
+    assert [movie["id"] for movie in response_data["movies"]] == [
+        movie_ids[2],
+        movie_ids[0],
+        movie_ids[1],
+    ], "Movies are not in request order."
+    assert response_data["missing_ids"] == [99999], "Missing ids were not reported."
+    for movie in response_data["movies"]:
+        assert {"country", "genres", "actors", "languages"} <= set(movie.keys())
+
+    response = await client.get("/api/v1/theater/movies/batch/", params={"ids": "1,abc"})
+    assert response.status_code == 422, "Non-integer ids should be rejected."
+
+
+@pytest.mark.asyncio
+async def test_movie_list_sparse_fields(client, seed_database):
+    """
+    Test that `fields=` narrows the movie list items and is kept in the page links.
+    """
+    response = await client.get("/api/v1/theater/movies/?per_page=5&fields=id,name,score")
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+
+    for movie in response_data["movies"]:
+        assert set(movie.keys()) == {"id", "name", "score"}, f"Unexpected fields: {movie}"
+    assert "fields=id%2Cname%2Cscore" in response_data["next_page"], (
+        "Next page link should keep the fields parameter."
+    )
+
+    response = await client.get("/api/v1/theater/movies/?fields=id,budget")
+    assert response.status_code == 422, "Unknown list fields should be rejected."
+
+
+@pytest.mark.asyncio
+async def test_get_movie_by_id_sparse_fields(client, db_session, seed_database):
+    """
+    Test that `fields=` on the detail endpoint returns only the requested columns and relations.
+    """
+    movie = (
+        await db_session.execute(
+            select(MovieModel).options(joinedload(MovieModel.genres)).limit(1)
+        )
+    ).unique().scalars().first()
+
+    response = await client.get(
+        f"/api/v1/theater/movies/{movie.id}/", params={"fields": "name,status,genres"}
+    )
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    response_data = response.json()
+
+    assert set(response_data.keys()) == {"name", "status", "genres"}
+    assert response_data["name"] == movie.name, "Name does not match."
+    assert response_data["status"] == movie.status.value, "Status does not match."
+    assert sorted(genre["id"] for genre in response_data["genres"]) == sorted(
+        genre.id for genre in movie.genres
+    ), "Genres do not match."
+
+
+@pytest.mark.asyncio
+async def test_export_movies_ndjson_with_relations(client, db_session, seed_database):
+    """
+    Test that `/movies/export/` streams every movie as one NDJSON line with its genres.
+    """
+    total_movies = (
+        await db_session.execute(select(func.count(MovieModel.id)))
+    ).scalar_one()
+    movie = (
+        await db_session.execute(
+            select(MovieModel).options(joinedload(MovieModel.genres)).limit(1)
+        )
+    ).unique().scalars().first()
+
+    response = await client.get(
+        "/api/v1/theater/movies/export/", params={"format": "ndjson", "include": "genres"}
+    )
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == total_movies, "Every movie should be exported exactly once."
+
+    exported = next(record for record in records if record["id"] == movie.id)
+    assert exported["name"] == movie.name, "Name does not match."
+    assert sorted(exported["genres"]) == sorted(genre.name for genre in movie.genres)
+
+
+@pytest.mark.asyncio
+async def test_export_movies_csv(client, db_session, seed_database):
+    """
+    Test that the CSV export starts with a header row and has one row per movie.
+    """
+    total_movies = (
+        await db_session.execute(select(func.count(MovieModel.id)))
+    ).scalar_one()
+
+    response = await client.get("/api/v1/theater/movies/export/?format=csv")
+    assert (
+        response.status_code == 200
+    ), f"Expected status code 200, but got {response.status_code}"
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][:3] == ["id", "name", "date"], f"Unexpected header: {rows[0]}"
+    assert len(rows) == total_movies + 1, "Expected a header and one row per movie."
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_movies(client, db_session):
+    """
+    Test that bulk creation inserts every new movie with its relations and reports
+    duplicates (within the request and against existing rows) as conflicts.
+    """
+    movie_data = {
+        "name": "Bulk Movie",
+        "date": "2025-01-01",
+        "score": 70.0,
+        "overview": "Bulk overview.",
+        "status": "Released",
+        "budget": 1000000.00,
+        "revenue": 2000000.00,
+        "country": "US",
+        "genres": ["Action", "Drama"],
+        "actors": ["John Doe"],
+        "languages": ["English"],
+    }
+    existing = {**movie_data, "name": "Existing Movie"}
+    response = await client.post("/api/v1/theater/movies/", json=existing)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    payload = {
+        "movies": [
+            movie_data,
+            {**movie_data, "name": "Bulk Movie 2", "genres": ["Action", "Comedy"]},
+            movie_data,
+            existing,
+        ]
+    }
+    response = await client.post("/api/v1/theater/movies/bulk/", json=payload)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    response_data = response.json()
+    assert response_data["created"] == 2, "Expected two created movies."
+    assert response_data["conflicts"] == 2, "Expected two conflicts."
+    statuses = [result["status"] for result in response_data["results"]]
+    assert statuses == ["created", "created", "conflict", "conflict"]
+
+    movie_id = response_data["results"][1]["id"]
+    response = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert sorted(genre["name"] for genre in response.json()["genres"]) == ["Action", "Comedy"]
+
+    total = await db_session.get(CounterModel, "movies_total")
+    assert total.value == 3, "The movies counter should include the bulk-created movies."
+
+    payload = {"movies": [{**movie_data, "name": "Bulk Movie 3", "country": "USAX"}]}
+    response = await client.post("/api/v1/theater/movies/bulk/", json=payload)
+    assert response.status_code == 422, "Values longer than their columns should be rejected."
+
+
+@pytest.mark.asyncio
+async def test_create_movie_inserts_new_entities_in_sorted_order(client, db_session):
+    """
+    Test that new entity names are inserted in sorted order whatever the request order,
+    so concurrent creates lock the unique index in the same order.
+    """
+    inserts = []
+
+    def record_insert(conn, cursor, statement, parameters, *args):
+        if statement.lstrip().startswith("INSERT INTO actors "):
+            inserts.append(list(parameters))
+
+    engine = db_session.bind.sync_engine
+    movie_data = {
+        "name": "Sorted Cast",
+        "date": "2025-01-01",
+        "score": 70.0,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000000.00,
+        "revenue": 2000000.00,
+        "country": "US",
+        "genres": ["Action"],
+        "actors": ["Zed Actor", "Abe Actor", "Max Actor"],
+        "languages": ["English"],
+    }
+    event.listen(engine, "before_cursor_execute", record_insert)
+    try:
+        response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_insert)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    assert inserts == [["Abe Actor", "Max Actor", "Zed Actor"]], f"Unexpected inserts: {inserts}"
+
+
+@pytest.mark.asyncio
+async def test_create_movie_round_trips_do_not_depend_on_cast_size(client, db_session):
+    """
+    Test that creating a movie runs the same number of statements for a small and a large
+    cast, and that reusing existing entities does not fail on their unique constraints.
+    """
+    statements = []
+
+    def count_statement(*args):
+        statements.append(args[2])
+
+    engine = db_session.bind.sync_engine
+    movie_data = {
+        "name": "Small Cast",
+        "date": "2025-01-01",
+        "score": 70.0,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000000.00,
+        "revenue": 2000000.00,
+        "country": "US",
+        "genres": ["Action"],
+        "actors": ["Actor 0"],
+        "languages": ["English"],
+    }
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+
+    small_cast = {**movie_data, "name": "Small Cast 2", "actors": ["Actor 0", "Actor 1"]}
+    large_cast = {
+        **movie_data,
+        "name": "Large Cast",
+        "actors": [f"Actor {i}" for i in range(40)],
+    }
+
+    counts = []
+    for payload in (small_cast, large_cast):
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            response = await client.post("/api/v1/theater/movies/", json=payload)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+        assert len(response.json()["actors"]) == len(payload["actors"])
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1], f"Statement count grew with the cast size: {counts}"
+
+
+@pytest.mark.asyncio
+async def test_reference_cache_skips_lookups_and_ignores_rollbacks(client, db_session):
+    """
+    Test that committed reference ids are cached so a later create does not query the
+    reference tables, while ids from a rolled-back create are not cached.
+    """
+    movie_data = {
+        "name": "Cached Movie",
+        "date": "2025-01-01",
+        "score": 70.0,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000000.00,
+        "revenue": 2000000.00,
+        "country": "US",
+        "genres": ["Action"],
+        "actors": ["Actor 0"],
+        "languages": ["English"],
+    }
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    assert reference_cache.get(GenreModel, "Action") is not None, "Genre id was not cached."
+
+    statements = []
+
+    def record_statement(*args):
+        statements.append(args[2])
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        response = await client.post(
+            "/api/v1/theater/movies/", json={**movie_data, "name": "Cached Movie 2"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    reference_queries = [
+        statement for statement in statements
+        if statement.lstrip().upper().startswith("SELECT")
+        and any(f"FROM {table}" in statement for table in ("genres", "actors", "languages", "countries"))
+    ]
+    assert not reference_queries, f"Unexpected reference lookups: {reference_queries}"
+
+    response = await client.post(
+        "/api/v1/theater/movies/", json={**movie_data, "genres": ["Rolled Back"]}
+    )
+    assert response.status_code == 409, f"Expected status code 409, but got {response.status_code}"
+    assert reference_cache.get(GenreModel, "Rolled Back") is None, "Rolled-back id was cached."
+
+
+@pytest.mark.asyncio
+async def test_update_movie_relations_writes_only_the_difference(client, db_session):
+    """
+    Test that PATCH replaces the country and relation lists, deleting and inserting only the
+    association rows that changed.
+    """
+    movie_data = {
+        "name": "Relations Movie",
+        "date": "2025-01-01",
+        "score": 70.0,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000000.00,
+        "revenue": 2000000.00,
+        "country": "US",
+        "genres": ["Action", "Drama"],
+        "actors": [f"Actor {i}" for i in range(60)],
+        "languages": ["English"],
+    }
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    assert response.status_code == 201, f"Expected status code 201, but got {response.status_code}"
+    movie_id = response.json()["id"]
+
+    statements = []
+
+    def record_statement(*args):
+        statements.append(args[2])
+
+    actors = movie_data["actors"][1:] + ["New Actor"]
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        response = await client.patch(
+            f"/api/v1/theater/movies/{movie_id}/",
+            json={"country": "FR", "actors": actors, "genres": ["Drama"]},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    association_writes = [
+        statement
+        for statement in statements
+        if "actors_movies" in statement and not statement.lstrip().startswith("SELECT")
+    ]
+    assert len(association_writes) == 2, f"Expected one DELETE and one INSERT: {association_writes}"
+
+    response = await client.get(f"/api/v1/theater/movies/{movie_id}/")
+    response_data = response.json()
+    assert response_data["country"]["code"] == "FR", "Country was not updated."
+    assert sorted(actor["name"] for actor in response_data["actors"]) == sorted(actors)
+    assert [genre["name"] for genre in response_data["genres"]] == ["Drama"]
+
+    response = await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"country": "ABCDEFG"})
+    assert response.status_code == 422, "Values longer than their columns should be rejected."
+
+
+@pytest.mark.asyncio
+async def test_update_movie_scalar_patch_uses_single_update(client, db_session, seed_database):
+    """
+    Test that a scalar-only PATCH updates the movie with one UPDATE ... RETURNING and no
+    SELECT, shifts the stats sums with one more UPDATE, and still reports a missing movie
+    as 404.
+    """
+    movie = (await db_session.execute(select(MovieModel).limit(1))).scalars().one()
+
+    statements = []
+
+    def record_statement(*args):
+        statements.append(args[2])
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        response = await client.patch(
+            f"/api/v1/theater/movies/{movie.id}/", json={"score": 42.0}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+
+    statements = [statement.lstrip() for statement in statements]
+    assert len(statements) == 3, f"Expected three statements: {statements}"
+    assert statements[0].startswith("UPDATE movie_stats"), "Sums should be shifted in place."
+    assert statements[1].startswith("UPDATE movies") and "RETURNING" in statements[1]
+    assert statements[2].startswith("UPDATE counters")
+
+    response = await client.get(f"/api/v1/theater/movies/{movie.id}/")
+    assert response.json()["score"] == 42.0, "Score was not updated."
+
+    response = await client.patch("/api/v1/theater/movies/999999/", json={"score": 42.0})
+    assert response.status_code == 404, f"Expected status code 404, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_movies_by_ids_and_filter(client, db_session, seed_database):
+    """
+    Test that bulk delete removes movies by id list or by date filter, cascades to the
+    association rows and keeps the movies counter in sync.
+    """
+    movie_ids = (
+        await db_session.execute(select(MovieModel.id).order_by(MovieModel.id).limit(2))
+    ).scalars().all()
+
+    response = await client.post(
+        "/api/v1/theater/movies/bulk-delete/", json={"ids": [*movie_ids, 999999]}
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json() == {"deleted": 2}, "Only existing movies should be counted."
+
+    orphaned = (
+        await db_session.execute(
+            select(func.count()).where(MoviesGenresModel.c.movie_id.in_(movie_ids))
+        )
+    ).scalar_one()
+    assert orphaned == 0, "Association rows of deleted movies should be removed."
+
+    cutoff = datetime.date(2022, 1, 1)
+    expected = (
+        await db_session.execute(
+            select(func.count(MovieModel.id)).where(MovieModel.date <= cutoff)
+        )
+    ).scalar_one()
+    response = await client.post(
+        "/api/v1/theater/movies/bulk-delete/", json={"date_to": cutoff.isoformat()}
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    assert response.json()["deleted"] == expected > 0, "Unexpected number of deleted movies."
+
+    response = await client.get("/api/v1/theater/movies/?page=1&per_page=1")
+    remaining = (await db_session.execute(select(func.count(MovieModel.id)))).scalar_one()
+    assert response.json()["total_items"] == remaining, "Counter is out of sync."
+
+    response = await client.post("/api/v1/theater/movies/bulk-delete/", json={})
+    assert response.status_code == 422, f"Expected status code 422, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_genre_movies_keyset_pagination(client, db_session, seed_database):
+    """
+    Test that movies of a genre are listed newest first and that following the cursors
+    visits every movie of the genre exactly once.
+    """
+    genre = (
+        await db_session.execute(select(GenreModel).where(GenreModel.name == "Action"))
+    ).scalars().one()
+    expected = (
+        await db_session.execute(
+            select(MoviesGenresModel.c.movie_id)
+            .where(MoviesGenresModel.c.genre_id == genre.id)
+            .order_by(MoviesGenresModel.c.movie_id.desc())
+        )
+    ).scalars().all()
+    assert len(expected) > 2, "The test data should have several action movies."
+
+    seen = []
+    url = f"/api/v1/theater/genres/{genre.id}/movies/?per_page=2"
+    while True:
+        response = await client.get(url)
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        response_data = response.json()
+        seen += [movie["id"] for movie in response_data["movies"]]
+        if response_data["next_cursor"] is None:
+            break
+        url = f"/api/v1{response_data['next_page']}"
+    assert seen == list(expected), "Pages should cover the genre's movies in id order."
+
+    last_page_size = len(response_data["movies"])
+    response = await client.get(f"/api/v1{response_data['prev_page']}")
+    previous = [movie["id"] for movie in response.json()["movies"]]
+    assert previous == seen[-last_page_size - 2 : -last_page_size], "Unexpected previous page."
+
+    response = await client.get("/api/v1/theater/actors/999999/movies/")
+    assert response.status_code == 404, f"Expected status code 404, but got {response.status_code}"
+
+
+@pytest.mark.asyncio
+async def test_movie_stats_follow_writes(client, db_session, seed_database):
+    """
+    Test that the stats rollups match the catalogue after seeding and stay in sync through
+    create, update and delete.
+    """
+
+    async def genre_stats():
+        response = await client.get("/api/v1/theater/stats/genre/")
+        assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+        return {item["key"]: item for item in response.json()["items"]}
+
+    async def expected_action():
+        rows = (
+            await db_session.execute(
+                select(func.count(MovieModel.id), func.avg(MovieModel.score))
+                .join(MoviesGenresModel, MoviesGenresModel.c.movie_id == MovieModel.id)
+                .join(GenreModel, GenreModel.id == MoviesGenresModel.c.genre_id)
+                .where(GenreModel.name == "Action")
+            )
+        ).one()
+        return rows[0], round(rows[1], 2)
+
+    stats = await genre_stats()
+    assert (stats["Action"]["movie_count"], stats["Action"]["average_score"]) == await expected_action()
+
+    movie_data = {
+        "name": "Stats Movie",
+        "date": "2025-01-01",
+        "score": 10.0,
+        "overview": "Overview.",
+        "status": "Released",
+        "budget": 1000000.00,
+        "revenue": 2000000.00,
+        "country": "US",
+        "genres": ["Action"],
+        "actors": ["Actor 0"],
+        "languages": ["English"],
+    }
+    response = await client.post("/api/v1/theater/movies/", json=movie_data)
+    movie_id = response.json()["id"]
+    await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"score": 20.0})
+    stats = await genre_stats()
+    assert (stats["Action"]["movie_count"], stats["Action"]["average_score"]) == await expected_action()
+
+    response = await client.patch(
+        f"/api/v1/theater/movies/{movie_id}/",
+        json={"score": 30.0, "budget": 5.0, "actors": ["Actor 1"]},
+    )
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    stats = await genre_stats()
+    assert (stats["Action"]["movie_count"], stats["Action"]["average_score"]) == await expected_action()
+
+    await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"genres": ["Documentary"]})
+    response = await client.patch(f"/api/v1/theater/movies/{movie_id}/", json={"date": "1901-05-05"})
+    assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}"
+    stats = await genre_stats()
+    assert stats["Documentary"]["movie_count"] == 1
+    assert (stats["Action"]["movie_count"], stats["Action"]["average_score"]) == await expected_action()
+
+    response = await client.get("/api/v1/theater/stats/year/")
+    years = {item["key"]: item for item in response.json()["items"]}
+    assert years["1901"]["movie_count"] == 1, "The movie should move to its new release year."
+
+    await client.delete(f"/api/v1/theater/movies/{movie_id}/")
+    stats = await genre_stats()
+    assert "Documentary" not in stats, "Empty rollup rows should be removed."
+
+    response = await client.get("/api/v1/theater/stats/status/")
+    statuses = {item["key"]: item["movie_count"] for item in response.json()["items"]}
+    total = (await db_session.execute(select(func.count(MovieModel.id)))).scalar_one()
+    assert statuses == {"Released": total}
+
+
+@pytest.mark.asyncio
+async def test_seed_streaming_matches_full_load(db_session, tmp_path):
+    """
+    Test that seeding the CSV in small chunks skips duplicates across chunks and produces
+    the same movies and associations as loading the whole file at once.
+    """
+    settings = get_settings()
+    source = pd.read_csv(settings.PATH_TO_MOVIES_CSV)
+    csv_path = tmp_path / "movies.csv"
+    pd.concat([source, source.head(7)]).to_csv(csv_path, index=False)
+
+    seeder = CSVDatabaseSeeder(str(csv_path), db_session, chunk_rows=5)
+    await seeder.seed()
+
+    movies = (await db_session.execute(select(func.count(MovieModel.id)))).scalar_one()
+    assert movies == len(source.drop_duplicates(subset=["names", "date_x"]))
+    total = await db_session.get(CounterModel, "movies_total")
+    assert total.value == movies, "The movies counter should match the seeded movies."
+    streamed_genres = (
+        await db_session.execute(select(func.count()).select_from(MoviesGenresModel))
+    ).scalar_one()
+
+    await reset_database()
+    full_seeder = CSVDatabaseSeeder(str(csv_path), db_session)
+    await full_seeder.seed()
+    full_genres = (
+        await db_session.execute(select(func.count()).select_from(MoviesGenresModel))
+    ).scalar_one()
+    assert streamed_genres == full_genres, "Streaming should create the same associations."
+
+
+@pytest.mark.asyncio
+async def test_seed_incremental_writes_only_changes(db_session, tmp_path):
+    """
+    Test that an incremental seed of an updated CSV inserts new movies, adds new association
+    rows, updates changed scores when enabled and leaves everything else untouched.
+    """
+    settings = get_settings()
+    source = pd.read_csv(settings.PATH_TO_MOVIES_CSV)
+    csv_path = tmp_path / "movies.csv"
+    source.head(20).to_csv(csv_path, index=False)
+    await CSVDatabaseSeeder(str(csv_path), db_session).seed()
+
+    updated = source.copy()
+    updated.loc[0, "score"] = 12.5
+    updated.loc[1, "genre"] = f"{updated.loc[1, 'genre']},Incremental Genre"
+    updated.to_csv(csv_path, index=False)
+
+    first, second, untouched = (
+        await db_session.execute(
+            select(MovieModel.id, MovieModel.version).where(
+                MovieModel.name.in_(source["names"].head(3).tolist())
+            ).order_by(MovieModel.id)
+        )
+    ).all()
+
+    seeder = CSVDatabaseSeeder(
+        str(csv_path), db_session, incremental=True, update_existing=True
+    )
+    await seeder.seed()
+    db_session.expire_all()
+
+    movies = (await db_session.execute(select(func.count(MovieModel.id)))).scalar_one()
+    assert movies == len(source), "New movies should be inserted."
+    total = await db_session.get(CounterModel, "movies_total")
+    assert total.value == movies, "The movies counter should include the new movies."
+
+    rows = {
+        row.id: row
+        for row in (
+            await db_session.execute(
+                select(MovieModel).where(MovieModel.id.in_([first.id, second.id, untouched.id]))
+            )
+        ).scalars()
+    }
+    assert rows[first.id].score == 12.5, "Changed score should be updated."
+    assert rows[first.id].version == first.version + 1
+    assert rows[second.id].version == second.version + 1
+    assert rows[untouched.id].version == untouched.version, "Unchanged movies must not be written."
+
+    genre = (
+        await db_session.execute(select(GenreModel).where(GenreModel.name == "Incremental Genre"))
+    ).scalars().one()
+    linked = (
+        await db_session.execute(
+            select(MoviesGenresModel.c.movie_id).where(MoviesGenresModel.c.genre_id == genre.id)
+        )
+    ).scalars().all()
+    assert linked == [second.id], "The new genre should be linked to the second movie only."
+
+
+@pytest.mark.asyncio
+async def test_seed_reuses_preprocessed_artifact(db_session, tmp_path, monkeypatch):
+    """
+    Test that seeding leaves the source CSV untouched, stores the cleaned data as a Parquet
+    artifact and loads it on the next run without parsing the CSV again.
+    """
+    settings = get_settings()
+    csv_path = tmp_path / "movies.csv"
+    csv_path.write_bytes(open(settings.PATH_TO_MOVIES_CSV, "rb").read())
+    original = csv_path.read_bytes()
+    cache_dir = tmp_path / "cache"
+
+    seeder = CSVDatabaseSeeder(str(csv_path), db_session, cache_dir=str(cache_dir))
+    await seeder.seed()
+    assert csv_path.read_bytes() == original, "The source CSV must not be rewritten."
+    assert len(list(cache_dir.glob("movies-*.parquet"))) == 1, "Expected one artifact."
+
+    cleaned = CSVDatabaseSeeder(str(csv_path), db_session)._preprocess_csv()
+
+    def fail_read_csv(*args, **kwargs):
+        raise AssertionError("The CSV should not be parsed when the artifact is current.")
+
+    monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+    cached = CSVDatabaseSeeder(str(csv_path), db_session, cache_dir=str(cache_dir))._preprocess_csv()
+    pd.testing.assert_frame_equal(cached, cleaned)
+    assert isinstance(cached.loc[0, "date_x"], datetime.date)